@@ -23,8 +23,11 @@ def main():
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # Use Fusion style for consistent cross-platform look
     
-    # Create and show the main window
-    window = MainWindow(file_monitor=file_monitor)
+    # Create and show the main window; --no-tray skips the system tray
+    # (useful headless or on desktops without a tray), making window
+    # close quit the app instead of minimizing
+    enable_tray = "--no-tray" not in sys.argv
+    window = MainWindow(file_monitor=file_monitor, enable_tray=enable_tray)
     window.show()
     
     # Start file monitoring
@@ -36,9 +39,8 @@ def main():
     exit_code = app.exec()
     
     # Cleanup on exit
-    if file_monitor.is_running():
-        file_monitor.stop()
-        logger.info("File monitoring stopped")
+    file_monitor.shutdown()
+    logger.info("File monitoring stopped")
         
     logger.info("Application terminated")
     sys.exit(exit_code)
@@ -2,16 +2,52 @@
 File monitoring module for Downloads Sorter application.
 Uses watchdog to detect new files in the monitored directory.
 """
+import os
 import time
+import heapq
 import logging
 import threading
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
 from .file_sorter import FileSorter
-from .utils import load_config
+from .utils import load_config, DEFAULT_DOWNLOADS
+
+# Filesystem types where inotify/ReadDirectoryChangesW events are unreliable
+# and polling is the only dependable option
+NETWORK_FS_TYPES = {"cifs", "smb3", "nfs", "nfs4", "fuse.sshfs"}
+
+def is_network_mount(path):
+    """Best-effort check whether a path lives on a network filesystem"""
+    try:
+        if os.name == "nt":
+            import ctypes
+            drive = os.path.splitdrive(os.path.abspath(str(path)))[0] + "\\"
+            # DRIVE_REMOTE == 4
+            return ctypes.windll.kernel32.GetDriveTypeW(drive) == 4
+
+        path = os.path.abspath(str(path))
+        best_match = ""
+        best_fstype = None
+        with open("/proc/self/mountinfo") as f:
+            for line in f:
+                pre, sep, post = line.partition(" - ")
+                if not sep:
+                    continue
+                fields = pre.split()
+                if len(fields) < 5:
+                    continue
+                mount_point = fields[4]
+                if path.startswith(mount_point) and len(mount_point) > len(best_match):
+                    best_match = mount_point
+                    best_fstype = post.split()[0]
+        return best_fstype in NETWORK_FS_TYPES
+    except Exception:
+        return False
 
 class DownloadHandler(FileSystemEventHandler):
     """
@@ -22,47 +58,140 @@ class DownloadHandler(FileSystemEventHandler):
         self.logger = logging.getLogger("DownloadHandler")
         self.config = load_config()
         self.sorter = FileSorter()
-        self.processing_queue = {}
-        
-    def on_created(self, event):
-        """Called when a file is created in the monitored directory"""
+        # Pending files as a min-heap of (ready_at, path_str) so the drain
+        # loop peeks the next-due entry in O(1) instead of scanning every
+        # queued file per tick. The dict holds the authoritative ready time
+        # per path; heap entries that disagree are stale (re-armed or
+        # removed) and skipped lazily on pop.
+        self._heap = []
+        self._ready_at = {}
+        self.new_file_event = threading.Event()
+
+    # Event types this handler acts on; everything else (opened, deleted,
+    # attribute-only closes, ...) is dropped in dispatch before any Python
+    # handler machinery runs
+    _HANDLED_EVENTS = frozenset({"created", "moved", "modified", "closed"})
+
+    def dispatch(self, event):
+        """Pre-filter events before watchdog's per-type dispatch.
+
+        An active Downloads folder produces far more events than this
+        handler cares about (directory churn, opens, deletes); rejecting
+        them here skips the per-event method lookup and path handling.
+        """
         if event.is_directory:
             return
-            
-        file_path = Path(event.src_path)
-        
-        # Skip files that match exclusion patterns
+        if event.event_type not in self._HANDLED_EVENTS:
+            return
+        super().dispatch(event)
+
+    def has_pending(self):
+        """Return True while any file is waiting to be sorted"""
+        return bool(self._ready_at)
+
+    def _is_excluded(self, path_str):
+        """Check whether a file matches an exclusion pattern (partial
+        downloads such as .crdownload/.part stay out of the queue)"""
+        name = os.path.basename(path_str)
         for pattern in self.config.get("exclusions", []):
-            if pattern in file_path.name:
-                return
-                
-        # Add to processing queue with timestamp
-        self.processing_queue[file_path] = time.time()
-        self.logger.info(f"New file detected: {file_path}")
-        
+            if pattern in name:
+                return True
+        return False
+
+    def _enqueue(self, path_str, ready_at=None):
+        """Add a file to the processing queue and wake the drain thread.
+
+        Without an explicit ready_at the file waits out the configured
+        settle delay before being sorted.
+        """
+        if ready_at is None:
+            ready_at = time.time() + self.config.get("sort_delay", 5)
+        self._ready_at[path_str] = ready_at
+        heapq.heappush(self._heap, (ready_at, path_str))
+        self.new_file_event.set()
+        self.logger.info("New file detected: %s", path_str)
+
+    def on_created(self, event):
+        """Called when a file is created in the monitored directory"""
+        if self._is_excluded(event.src_path):
+            return
+
+        self._enqueue(event.src_path)
+
+    def on_moved(self, event):
+        """Called when a file is renamed into its final name.
+
+        Browsers download to a temp name (.crdownload/.part) and rename on
+        completion; the rename is the only event carrying the final name,
+        so it is queued here. The temp name, if queued, is dropped.
+        """
+        self._ready_at.pop(event.src_path, None)
+
+        if self._is_excluded(event.dest_path):
+            return
+
+        self._enqueue(event.dest_path)
+
+    def on_closed(self, event):
+        """Called when a writer closes a file (inotify IN_CLOSE_WRITE).
+
+        The close is the authoritative download-finished signal, so the
+        file is (re)queued with no settle delay instead of waiting out
+        sort_delay. Backends without close events (FSEvents, polling)
+        simply never call this and fall back to on_created's delayed
+        enqueue.
+        """
+        if self._is_excluded(event.src_path):
+            return
+
+        self._enqueue(event.src_path, ready_at=time.time())
+
+    def on_modified(self, event):
+        """Called when a file is modified in the monitored directory.
+
+        Only coalesces: a write to an already-queued file re-arms its
+        settle timer so a download still in progress is not sorted
+        half-written. Modifications never trigger work on their own.
+        """
+        path_str = event.src_path
+        if path_str in self._ready_at:
+            ready_at = time.time() + self.config.get("sort_delay", 5)
+            self._ready_at[path_str] = ready_at
+            heapq.heappush(self._heap, (ready_at, path_str))
+
+    def seconds_until_ready(self):
+        """Return seconds until the oldest queued file is ready to sort.
+
+        Returns None when the queue is empty.
+        """
+        while self._heap:
+            ready_at, path_str = self._heap[0]
+            if self._ready_at.get(path_str) != ready_at:
+                # Stale entry: the file was re-armed or removed
+                heapq.heappop(self._heap)
+                continue
+            return max(0.0, ready_at - time.time())
+        return None
+
     def process_queue(self):
         """Process files in queue after delay to ensure download completion"""
-        current_time = time.time()
-        files_to_remove = []
-        
-        for file_path, timestamp in list(self.processing_queue.items()):
-            # Only process files after delay (to ensure download completion)
-            delay = self.config.get("sort_delay", 5)
-            if current_time - timestamp > delay:
-                min_size = self.config.get("min_file_size", 1024)
-                if file_path.exists() and file_path.stat().st_size > min_size:
-                    try:
-                        self.sorter.sort_file(file_path)
-                        files_to_remove.append(file_path)
-                    except Exception as e:
-                        self.logger.error(f"Error sorting {file_path}: {e}")
-                else:
-                    # Remove non-existent or too small files
-                    files_to_remove.append(file_path)
-                    
-        # Remove processed files from queue
-        for file_path in files_to_remove:
-            self.processing_queue.pop(file_path, None)
+        now = time.time()
+
+        while self._heap and self._heap[0][0] <= now:
+            ready_at, path_str = heapq.heappop(self._heap)
+            if self._ready_at.get(path_str) != ready_at:
+                # Stale entry: the file was re-armed or removed
+                continue
+            del self._ready_at[path_str]
+
+            file_path = Path(path_str)
+            min_size = self.config.get("min_file_size", 1024)
+            # Skip non-existent or too small files
+            if file_path.exists() and file_path.stat().st_size > min_size:
+                try:
+                    self.sorter.sort_file(file_path)
+                except Exception as e:
+                    self.logger.error("Error sorting %s: %s", file_path, e)
 
 class FileMonitor:
     """
@@ -73,6 +202,7 @@ class FileMonitor:
         self.logger = logging.getLogger("FileMonitor")
         self.config = load_config()
         self.observer = None
+        self._watch = None
         self.handler = DownloadHandler()
         self.running = False
         self.stop_event = threading.Event()
@@ -80,6 +210,24 @@ class FileMonitor:
         self.scheduler_thread = None
         self.last_scan_time = None
         self.missed_schedules = []
+        self._last_dir_mtime_ns = None
+        self._config_dirty = False
+        self._flush_timer = None
+        # Completed schedules held in memory as datetimes: ISO strings are
+        # parsed once here and serialized only when the config is flushed.
+        # The deque trims to the last 50 automatically, the parallel set
+        # gives O(1) membership checks
+        completed = []
+        for time_str in self.config.get("completed_schedules", []):
+            try:
+                completed.append(datetime.fromisoformat(time_str))
+            except ValueError:
+                pass
+        self._completed_schedules = deque(completed, maxlen=50)
+        self._completed_set = set(self._completed_schedules)
+        # Scheduled times parsed once into minute-of-day ints
+        self._sched_minutes = []
+        self._sched_source = None
         
     def start(self):
         """Start the appropriate monitoring mode based on config"""
@@ -99,18 +247,34 @@ class FileMonitor:
         else:  # scheduled mode
             self._start_scheduled_monitoring()
             
-        self.logger.info(f"Started file monitor in {scan_mode} mode")
+        self.logger.info("Started file monitor in %s mode", scan_mode)
         
     def _start_regular_monitoring(self):
         """Start continuous file monitoring using watchdog"""
-        # Create a new observer instance for regular monitoring
-        self.observer = Observer()
-        
-        downloads_path = Path(self.config.get("source_folder", str(Path.home() / "Downloads")))
-        self.observer.schedule(self.handler, str(downloads_path), recursive=False)
-        
-        self.observer.start()
-        
+        downloads_path = Path(self.config.get("source_folder", DEFAULT_DOWNLOADS))
+
+        # Pick the observer backend: native kernel events by default, but
+        # fall back to polling for network mounts where events are dropped
+        backend = self.config.get("monitor_backend", "auto")
+        use_polling = backend == "poll" or (backend == "auto" and is_network_mount(downloads_path))
+
+        # The observer thread is reused across pause/resume toggles; only a
+        # backend switch forces a fresh one (observer threads cannot be
+        # restarted once stopped)
+        if self.observer is not None and use_polling != isinstance(self.observer, PollingObserver):
+            self._shutdown_observer()
+
+        if self.observer is None:
+            if use_polling:
+                poll_interval = self.config.get("poll_interval", 3)
+                self.observer = PollingObserver(timeout=poll_interval)
+                self.logger.info("Using polling observer (interval: %ss)", poll_interval)
+            else:
+                self.observer = Observer()
+            self.observer.start()
+
+        self._watch = self.observer.schedule(self.handler, str(downloads_path), recursive=False)
+
         # Start processing thread
         self.process_thread = threading.Thread(target=self._process_loop)
         self.process_thread.daemon = True
@@ -127,139 +291,256 @@ class FileMonitor:
         if self.config.get("scan_when_back_online", True):
             self._check_missed_schedules()
             
+    def _parsed_schedule_minutes(self):
+        """Return scheduled times as sorted minute-of-day ints.
+
+        Parsed once and cached; rebuilt when the config's scheduled_times
+        list is replaced (how settings saves propagate).
+        """
+        times = self.config.get("scheduled_times", [])
+        if times is not self._sched_source:
+            parsed = set()
+            for time_str in times:
+                try:
+                    hour, minute = map(int, time_str.split(':'))
+                    parsed.add(hour * 60 + minute)
+                except ValueError:
+                    self.logger.error("Invalid scheduled time: %s", time_str)
+            self._sched_minutes = sorted(parsed)
+            self._sched_source = times
+        return self._sched_minutes
+
     def _scheduler_loop(self):
         """Background loop to run scheduled scans"""
         while not self.stop_event.is_set():
-            # Check if current time matches any scheduled time
+            # Compare integer minute-of-day values; no datetime arithmetic
+            # per scheduled entry on each wakeup
             current_time = datetime.now()
-            scheduled_times = self.config.get("scheduled_times", [])
-            
-            for time_str in scheduled_times:
+            now_minute = current_time.hour * 60 + current_time.minute
+
+            for sched_minute in self._parsed_schedule_minutes():
+                if sched_minute != now_minute:
+                    continue
+                if (self.last_scan_time is not None and
+                        (current_time - self.last_scan_time).total_seconds() <= 60):
+                    continue
                 try:
-                    # Parse scheduled time
-                    hour, minute = map(int, time_str.split(':'))
-                    scheduled_time = current_time.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    
-                    # If current time is within 59 seconds of scheduled time and we haven't run yet
-                    time_diff = abs((current_time - scheduled_time).total_seconds())
-                    
-                    if time_diff < 60 and (self.last_scan_time is None or 
-                                          (current_time - self.last_scan_time).total_seconds() > 60):
-                        self._run_scheduled_scan()
-                        # Update last scan time
-                        self.last_scan_time = current_time
-                        # Add to list of completed schedules
-                        self._add_completed_schedule(scheduled_time)
-                        break
+                    self._run_scheduled_scan()
+                    # Update last scan time
+                    self.last_scan_time = current_time
+                    # Add to list of completed schedules
+                    scheduled_time = current_time.replace(
+                        hour=sched_minute // 60, minute=sched_minute % 60,
+                        second=0, microsecond=0)
+                    self._add_completed_schedule(scheduled_time)
                 except Exception as e:
-                    self.logger.error(f"Error processing scheduled scan at {time_str}: {e}")
-            
-            # Sleep for 30 seconds before next check
-            time.sleep(30)
-            
+                    self.logger.error("Error processing scheduled scan at %02d:%02d: %s",
+                                      sched_minute // 60, sched_minute % 60, e)
+                break
+
+            # Park until the next scheduled time (clamped so config edits
+            # and stop() are noticed promptly) instead of a fixed 30 s nap
+            if self.stop_event.wait(timeout=self._seconds_until_next_schedule(datetime.now())):
+                break
+
+    def _seconds_until_next_schedule(self, now):
+        """Compute how long the scheduler can park before its next check.
+
+        Returns the seconds until the next scheduled time, clamped to
+        [1, 60]: tight 1 s polling just around a fire window, up to a
+        minute of sleep otherwise.
+        """
+        minutes = self._parsed_schedule_minutes()
+        if not minutes:
+            return 60.0
+
+        now_minute = now.hour * 60 + now.minute
+        best = None
+        for sched_minute in minutes:
+            delta = ((sched_minute - now_minute) % 1440) * 60 - now.second
+            if delta <= 0:
+                delta += 86400
+            if best is None or delta < best:
+                best = delta
+
+        return max(1.0, min(60.0, best))
+
     def _run_scheduled_scan(self):
         """Run a scheduled scan of the source directory"""
         self.logger.info("Running scheduled scan")
-        source_folder = self.config.get("source_folder", str(Path.home() / "Downloads"))
+        source_folder = self.config.get("source_folder", DEFAULT_DOWNLOADS)
         success_count = 0 # Initialize counts
         error_count = 0   # Initialize counts
 
         try:
-            # Use the file sorter to sort the entire directory
-            sorter = FileSorter()
-            success_count, error_count = sorter.sort_directory(source_folder) # Get the counts
-            self.logger.info(f"Scheduled scan completed: {success_count} files sorted, {error_count} errors")
+            success_count, error_count = self._scan_source(source_folder)
+            self.logger.info("Scheduled scan completed: %s files sorted, %s errors", success_count, error_count)
         except Exception as e:
-            self.logger.error(f"Error during scheduled scan: {e}")
+            self.logger.error("Error during scheduled scan: %s", e)
             # error_count might be implicitly 0 here, or could be set if needed
 
         return success_count, error_count # Return the counts
 
+    def _scan_source(self, source_folder):
+        """Sort the source folder, skipping the scan when it hasn't changed.
+
+        A directory's mtime is updated whenever entries are added or
+        removed, so an unchanged mtime (with no queued events) means the
+        previous scan's result still holds and readdir can be skipped.
+        """
+        try:
+            dir_mtime = os.stat(source_folder).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+
+        if (dir_mtime is not None and dir_mtime == self._last_dir_mtime_ns
+                and not self.handler.has_pending()):
+            self.logger.info("Source folder unchanged since last scan, skipping readdir")
+            return 0, 0
+
+        # Reuse the handler's long-lived sorter rather than building a
+        # fresh FileSorter (and its caches) for every scheduled scan
+        counts = self.handler.sorter.sort_directory(source_folder)
+        if not counts:
+            counts = (0, 1)
+
+        # Record the post-scan mtime (our own moves also touch the
+        # directory) -- but only after a clean pass. A failed pass may
+        # leave files behind without touching the directory, and caching
+        # its mtime would make every later scan skip straight past them.
+        if counts[1] == 0:
+            try:
+                self._last_dir_mtime_ns = os.stat(source_folder).st_mtime_ns
+            except OSError:
+                self._last_dir_mtime_ns = None
+        else:
+            self._last_dir_mtime_ns = None
+
+        return counts
+
     def _check_missed_schedules(self):
         """Check for any scheduled scans that were missed while offline"""
         if not self.config.get("scan_when_back_online", True):
             return
             
         current_time = datetime.now()
-        scheduled_times = self.config.get("scheduled_times", [])
-        completed_schedules = self.config.get("completed_schedules", [])
-        
+
         # Get the most recent completed schedule time
-        last_completed = None
-        if completed_schedules:
-            try:
-                last_completed = datetime.fromisoformat(completed_schedules[-1])
-            except (ValueError, IndexError):
-                pass
-                
+        last_completed = self._completed_schedules[-1] if self._completed_schedules else None
+
         # If we have no record of completed schedules, don't try to catch up
         if not last_completed:
             return
-            
-        # Check each scheduled time to see if we missed any
-        for time_str in scheduled_times:
-            try:
-                # Parse scheduled time
-                hour, minute = map(int, time_str.split(':'))
-                
-                # Check if there was a scheduled time between our last scan and now
-                for days_ago in range(1, 8):  # Check up to a week back
-                    check_date = current_time - timedelta(days=days_ago)
-                    scheduled_datetime = check_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    
-                    # If this scheduled time was after our last completion but before now,
-                    # and we haven't already run it, then we missed it
-                    if (last_completed < scheduled_datetime < current_time and 
-                        scheduled_datetime.isoformat() not in completed_schedules):
-                        self.missed_schedules.append(scheduled_datetime)
-            except Exception as e:
-                self.logger.error(f"Error checking for missed schedule {time_str}: {e}")
-                
+
+        # Single pass over the candidate slots in the window (today plus a
+        # week back): a slot is missed when it falls between the last
+        # completion and now and was never recorded as completed. The
+        # parsed minute cache already validated the configured times.
+        for days_ago in range(8):
+            day = (current_time - timedelta(days=days_ago)).replace(second=0, microsecond=0)
+            for sched_minute in self._parsed_schedule_minutes():
+                scheduled_datetime = day.replace(hour=sched_minute // 60,
+                                                 minute=sched_minute % 60)
+                if (last_completed < scheduled_datetime < current_time and
+                        scheduled_datetime not in self._completed_set):
+                    self.missed_schedules.append(scheduled_datetime)
+
         # Run a scan now if we missed any schedules
         if self.missed_schedules:
-            self.logger.info(f"Detected {len(self.missed_schedules)} missed scans, running catch-up scan now")
+            self.logger.info("Detected %s missed scans, running catch-up scan now", len(self.missed_schedules))
             self._run_scheduled_scan()
-            # Mark all as completed
+            # Mark all as completed, then flush the batch in one write
             for missed in self.missed_schedules:
                 self._add_completed_schedule(missed)
             self.missed_schedules = []
+            self._flush_config()
             
     def _add_completed_schedule(self, scheduled_time):
         """Add a completed schedule to the tracking list"""
-        if "completed_schedules" not in self.config:
-            self.config["completed_schedules"] = []
-            
-        # Convert to ISO format string
-        time_str = scheduled_time.isoformat()
-        
-        # Add to completed schedules
-        if time_str not in self.config["completed_schedules"]:
-            self.config["completed_schedules"].append(time_str)
-            
-        # Keep only last 50 completed schedules
-        if len(self.config["completed_schedules"]) > 50:
-            self.config["completed_schedules"] = self.config["completed_schedules"][-50:]
-            
-        # Save the updated config
+        if scheduled_time not in self._completed_set:
+            # The deque's maxlen drops the oldest entry automatically;
+            # mirror the eviction in the membership set
+            if len(self._completed_schedules) == self._completed_schedules.maxlen:
+                self._completed_set.discard(self._completed_schedules[0])
+            self._completed_schedules.append(scheduled_time)
+            self._completed_set.add(scheduled_time)
+
+        # Mark dirty and let the debounced flush coalesce bursts (e.g. a
+        # catch-up over several missed schedules) into one disk write;
+        # serialization to ISO strings happens there, at the save boundary
+        self._config_dirty = True
+        self._schedule_config_flush()
+
+    def _schedule_config_flush(self, delay=5.0):
+        """Arrange a debounced config save unless one is already pending"""
+        if self._flush_timer is not None:
+            return
+        timer = threading.Timer(delay, self._flush_config)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+
+    def _flush_config(self):
+        """Write the config to disk if there are unsaved changes"""
+        self._flush_timer = None
+        if not self._config_dirty:
+            return
+        self.config["completed_schedules"] = [
+            completed.isoformat() for completed in self._completed_schedules
+        ]
         from .utils import save_config
         save_config(self.config)
+        self._config_dirty = False
         
     def stop(self):
-        """Stop all monitoring"""
+        """Stop monitoring; the observer thread stays up for a quick resume"""
         if self.running:
             self.stop_event.set()
-            if self.observer:
-                self.observer.stop()
-                self.observer.join()
-                self.observer = None
+            # Wake the drain thread so it notices the stop promptly
+            self.handler.new_file_event.set()
+            # Unschedule the watch but keep the observer thread alive so a
+            # resume doesn't pay thread/inotify setup again
+            if self.observer is not None and self._watch is not None:
+                self.observer.unschedule(self._watch)
+                self._watch = None
             self.running = False
+            # Persist any completed schedules still waiting on the debounce
+            self._flush_config()
             self.logger.info("Stopped file monitoring")
+
+    def _shutdown_observer(self):
+        """Stop and join the reusable observer thread"""
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+            self._watch = None
+
+    def shutdown(self):
+        """Stop monitoring and release the observer thread (process exit)"""
+        self.stop()
+        self._shutdown_observer()
             
     def _process_loop(self):
-        """Background loop to process the file queue"""
+        """Background loop to process the file queue.
+
+        Event-driven: sleeps until the watchdog handler signals a new file
+        or until the oldest queued file has settled, instead of waking on
+        a fixed polling interval.
+        """
         while not self.stop_event.is_set():
+            timeout = self.handler.seconds_until_ready()
+            if timeout is None:
+                # Queue empty - block until an event arrives (capped so we
+                # still notice the stop event in a timely fashion)
+                self.handler.new_file_event.wait(timeout=5.0)
+                self.handler.new_file_event.clear()
+                continue
+            if timeout > 0:
+                # Wake early if a new file arrives while we wait
+                self.handler.new_file_event.wait(timeout=timeout)
+                self.handler.new_file_event.clear()
             self.handler.process_queue()
-            time.sleep(1)
             
     def is_running(self):
         """Check if the monitor is currently running"""
@@ -267,9 +548,9 @@ class FileMonitor:
         
     def scan_now(self):
         """Run a manual scan and return results"""
-        source_folder = self.config.get("source_folder", str(Path.home() / "Downloads"))
+        source_folder = self.config.get("source_folder", DEFAULT_DOWNLOADS)
         if not Path(source_folder).exists():
-            self.logger.error(f"Source folder for scan_now not found: {source_folder}")
+            self.logger.error("Source folder for scan_now not found: %s", source_folder)
             return 0, 0 # Return zero counts if folder doesn't exist
 
         if self.running:
@@ -279,5 +560,4 @@ class FileMonitor:
         else:
             # If not running, perform a one-time scan directly
             self.logger.info("Running one-time manual scan")
-            sorter = FileSorter()
-            return sorter.sort_directory(source_folder)
\ No newline at end of file
+            return self._scan_source(source_folder)
\ No newline at end of file
@@ -5,10 +5,15 @@ Handles the categorization and sorting of files based on their type.
 import os
 import logging
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from .utils import load_config
-from .stats import SortingStats
+from .utils import load_config, get_extension_map, DEFAULT_DOWNLOADS
+from .stats import get_stats
+
+# Maximum entries kept in the per-process classification cache
+CATEGORY_CACHE_MAX = 2048
 
 class FileSorter:
     """
@@ -18,94 +23,233 @@ class FileSorter:
     def __init__(self):
         self.logger = logging.getLogger("FileSorter")
         self.config = load_config()
-        self.stats = SortingStats()
-        
-    def get_category(self, file_path):
+        # Shared across all FileSorter instances; see stats.get_stats
+        self.stats = get_stats()
+        # Classification cache keyed by path, invalidated by mtime+size;
+        # locked because bulk sorts classify from the pool workers
+        self._category_cache = {}
+        self._category_cache_lock = threading.Lock()
+        # Flattened extension -> category lookup, rebuilt when the config's
+        # categories mapping is replaced
+        self._ext_to_cat = {}
+        self._ext_map_source = None
+        # Target paths claimed by in-flight moves, guarded for concurrent sorts
+        self._reserved_targets = set()
+        self._reserve_lock = threading.Lock()
+        # Device id per target directory, so the same-filesystem check
+        # costs one stat per directory instead of one per file
+        self._dir_dev = {}
+        # Target directories already created this run; repeats skip the
+        # mkdir syscall chain entirely
+        self._mkdir_seen = set()
+
+    def get_category(self, file_path, stat_result=None):
         """Determine the category of a file based on its extension"""
-        extension = file_path.suffix.lower()
-        
-        # Check each category for the extension
-        for category, extensions in self.config.get("categories", {}).items():
-            if extension in extensions:
-                return category
-                
-        # Return Others if no category matches
-        return "Others"
-    
-    def get_target_directory(self, file_path):
-        """Create the target directory path based on date and category"""
-        creation_date = datetime.fromtimestamp(file_path.stat().st_ctime)
-        category = self.get_category(file_path)
-        
+        path_str = os.fspath(file_path)
+
+        # Unchanged files (same mtime and size) reuse the cached decision
+        if stat_result is not None:
+            with self._category_cache_lock:
+                cached = self._category_cache.get(path_str)
+            if cached and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+                return cached[2]
+
+        extension = os.path.splitext(path_str)[1].lower()
+        category = self._extension_map().get(extension, "Others")
+
+        if stat_result is not None:
+            with self._category_cache_lock:
+                # Oldest-first eviction keeps the cache bounded
+                if len(self._category_cache) >= CATEGORY_CACHE_MAX:
+                    self._category_cache.pop(next(iter(self._category_cache)))
+                self._category_cache[path_str] = (stat_result.st_mtime_ns, stat_result.st_size, category)
+
+        return category
+
+    def _extension_map(self):
+        """Return the extension -> category dict, rebuilding it if the
+        config's categories mapping has been swapped out"""
+        categories = self.config.get("categories", {})
+        if categories is not self._ext_map_source:
+            self._ext_to_cat = get_extension_map(self.config)
+            self._ext_map_source = categories
+        return self._ext_to_cat
+
+    def get_target_directory(self, file_path, stat_result=None):
+        """Create the target directory path based on date and category.
+
+        Works on plain strings: the per-file path math here is hot during
+        bulk sorts, and os.path.join avoids the intermediate PurePath
+        allocations that `/` chaining would produce.
+        """
+        if stat_result is None:
+            stat_result = os.stat(file_path)
+        creation_date = datetime.fromtimestamp(stat_result.st_ctime)
+        category = self.get_category(file_path, stat_result)
+
         # Build path: destination/year/month/category
-        destination = Path(self.config.get("destination_folder", 
-                                         str(Path.home() / "Downloads")))
-        
+        destination = self.config.get("destination_folder", DEFAULT_DOWNLOADS)
+
         year_folder = str(creation_date.year)
         month_folder = creation_date.strftime("%m - %B")
-        
-        target_dir = destination / year_folder / month_folder / category
-        
-        # Create directory if it doesn't exist
-        target_dir.mkdir(parents=True, exist_ok=True)
-        
+
+        target_dir = os.path.join(destination, year_folder, month_folder, category)
+
+        # Create directory if it doesn't exist; most files in a batch share
+        # their target, so create each directory only once per process
+        if target_dir not in self._mkdir_seen:
+            os.makedirs(target_dir, exist_ok=True)
+            self._mkdir_seen.add(target_dir)
+
         return target_dir, category
         
-    def sort_file(self, file_path):
+    def sort_file(self, file_path, stat_result=None):
         """Sort a file into the appropriate directory"""
-        if not file_path.exists():
-            self.logger.warning(f"File no longer exists: {file_path}")
+        path_str = os.fspath(file_path)
+        if not os.path.exists(path_str):
+            self.logger.warning("File no longer exists: %s", path_str)
             return False
-            
+
         try:
-            target_dir, category = self.get_target_directory(file_path)
-            target_path = target_dir / file_path.name
-            
-            # Handle file conflicts (if target file already exists)
-            if target_path.exists():
-                base_name = target_path.stem
-                extension = target_path.suffix
-                counter = 1
-                
-                # Try adding a counter until we find an available filename
-                while target_path.exists():
-                    new_name = f"{base_name}_{counter}{extension}"
-                    target_path = target_dir / new_name
-                    counter += 1
-            
-            # Move the file
-            shutil.move(str(file_path), str(target_path))
-            self.logger.info(f"Moved file: {file_path} -> {target_path}")
-            
-            # Record statistics
-            self.stats.record_sorted_file(file_path, category, target_path)
-            
+            if stat_result is None:
+                stat_result = os.stat(path_str)
+            target_dir, category = self.get_target_directory(path_str, stat_result)
+            file_name = os.path.basename(path_str)
+            target_path = os.path.join(target_dir, file_name)
+
+            # Already where it belongs (e.g. a recursive scan walked over
+            # previously sorted output) -- nothing to move
+            if target_path == path_str:
+                return True
+
+            # Handle file conflicts (if target file already exists). The
+            # reservation set keeps concurrent moves from claiming the same
+            # target name before either move has completed.
+            with self._reserve_lock:
+                if os.path.exists(target_path) or target_path in self._reserved_targets:
+                    # Snapshot the directory once and probe candidate names
+                    # in memory instead of stat-ing per counter increment
+                    with os.scandir(target_dir) as it:
+                        existing = {e.name for e in it}
+
+                    base_name, extension = os.path.splitext(file_name)
+                    counter = 1
+                    candidate = f"{base_name}_{counter}{extension}"
+                    while candidate in existing or os.path.join(target_dir, candidate) in self._reserved_targets:
+                        counter += 1
+                        candidate = f"{base_name}_{counter}{extension}"
+                    target_path = os.path.join(target_dir, candidate)
+
+                self._reserved_targets.add(target_path)
+
+            # Move the file. When source and target sit on the same device
+            # the move is a single rename syscall via os.replace. Across
+            # devices, copy2 (which uses the kernel zero-copy paths where
+            # available) writes to a .part sibling that is atomically
+            # renamed into place, so a half-copied file never appears
+            # under its final name; the source is unlinked only after the
+            # rename has landed.
+            try:
+                renamed = False
+                if stat_result.st_dev == self._device_of(target_dir):
+                    # Matching st_dev does not guarantee rename works:
+                    # bind mounts and some overlay setups report the same
+                    # device yet still fail with EXDEV, so fall through
+                    # to the copy path instead of erroring out
+                    try:
+                        os.replace(path_str, target_path)
+                        renamed = True
+                    except OSError:
+                        pass
+                if not renamed:
+                    tmp_path = target_path + ".part"
+                    try:
+                        shutil.copy2(path_str, tmp_path)
+                        os.replace(tmp_path, target_path)
+                    except Exception:
+                        if os.path.exists(tmp_path):
+                            os.unlink(tmp_path)
+                        raise
+                    os.unlink(path_str)
+            finally:
+                with self._reserve_lock:
+                    self._reserved_targets.discard(target_path)
+            self.logger.info("Moved file: %s -> %s", path_str, target_path)
+
+            # Record statistics; the size comes from the stat we already
+            # have, since the source path no longer exists after the move
+            self.stats.record_sorted_file(path_str, category, target_path,
+                                          size_bytes=stat_result.st_size)
+
             return True
-            
+
         except Exception as e:
-            self.logger.error(f"Error sorting file {file_path}: {e}")
+            self.logger.error("Error sorting file %s: %s", file_path, e)
             return False
             
-    def sort_directory(self, directory_path):
-        """Sort all files in a directory (one-time bulk sort)"""
-        directory = Path(directory_path)
+    def _device_of(self, directory):
+        """Return the device id of a target directory, cached per directory"""
+        dev = self._dir_dev.get(directory)
+        if dev is None:
+            dev = os.stat(directory).st_dev
+            self._dir_dev[directory] = dev
+        return dev
+
+    def sort_directory(self, directory_path, recursive=False):
+        """Sort all files in a directory (one-time bulk sort).
+
+        With recursive=True, subdirectories are descended into as well,
+        except the destination folder's subtree so already-sorted files
+        are never picked up again.
+        """
+        directory = Path(directory_path).resolve()
         if not directory.exists() or not directory.is_dir():
-            self.logger.error(f"Invalid directory: {directory_path}")
+            self.logger.error("Invalid directory: %s", directory_path)
             return False
-            
+
         success_count = 0
         error_count = 0
-        
-        for file_path in directory.iterdir():
-            if file_path.is_file():
-                try:
-                    if self.sort_file(file_path):
-                        success_count += 1
-                    else:
-                        error_count += 1
-                except Exception as e:
-                    self.logger.error(f"Error sorting {file_path}: {e}")
-                    error_count += 1
+
+        destination = Path(self.config.get("destination_folder",
+                                           DEFAULT_DOWNLOADS)).resolve()
+
+        # Scandir passes: DirEntry caches is_file/stat results from the
+        # directory read, avoiding a separate stat syscall per entry
+        files = []
+        pending_dirs = [directory]
+        while pending_dirs:
+            current = pending_dirs.pop()
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        files.append((entry.path, entry.stat()))
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        if Path(entry.path) != destination:
+                            pending_dirs.append(entry.path)
+
+        # Moves are I/O-latency bound, so overlap them on a small thread
+        # pool instead of blocking on each one in turn
+        max_workers = min(self.config.get("max_concurrent_moves", 8), len(files)) if files else 0
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._sort_one, files))
+        else:
+            results = [self._sort_one(item) for item in files]
+
+        for result in results:
+            if result:
+                success_count += 1
+            else:
+                error_count += 1
                     
-        self.logger.info(f"Bulk sort complete. Success: {success_count}, Errors: {error_count}")
-        return success_count, error_count
\ No newline at end of file
+        self.logger.info("Bulk sort complete. Success: %s, Errors: %s", success_count, error_count)
+        return success_count, error_count
+
+    def _sort_one(self, item):
+        """Sort a single (path, stat) pair, trapping worker exceptions"""
+        file_path, stat_result = item
+        try:
+            return self.sort_file(file_path, stat_result)
+        except Exception as e:
+            self.logger.error("Error sorting %s: %s", file_path, e)
+            return False
\ No newline at end of file
@@ -4,11 +4,50 @@ Tracks file sorting statistics and provides methods to query them.
 """
 import json
 import time
+import atexit
 import logging
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 import sqlite3
-from collections import defaultdict, Counter
+from .utils import SORTIFY_DIR
+
+# Upper bound on per-file history rows; the aggregated stats_summary table
+# is unaffected, so totals survive pruning
+MAX_SORTED_FILES_ROWS = 10000
+
+# How often (in inserts) the retention pruning runs
+PRUNE_INTERVAL = 256
+
+# Batch limits for the background writer: commit whatever has queued up
+# after this many records or this much waiting, whichever comes first
+BATCH_MAX_RECORDS = 500
+BATCH_WINDOW_SECONDS = 0.1
+
+# Hot-path SQL held as module constants so every batch reuses the same
+# string objects and hits the connection's prepared-statement cache
+_SQL_INSERT_FILE = '''
+    INSERT INTO sorted_files
+    (file_name, file_path, category, size_bytes, timestamp, destination_path)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+_SQL_UPSERT_SUMMARY = '''
+    INSERT INTO stats_summary
+    (date, category, count, total_size_bytes)
+    VALUES (?, ?, 1, ?)
+    ON CONFLICT(date, category) DO UPDATE SET
+        count = count + 1,
+        total_size_bytes = total_size_bytes + excluded.total_size_bytes
+'''
+_SQL_UPSERT_MONTHLY = '''
+    INSERT INTO stats_monthly
+    (month, category, count, total_size_bytes)
+    VALUES (?, ?, 1, ?)
+    ON CONFLICT(month, category) DO UPDATE SET
+        count = count + 1,
+        total_size_bytes = total_size_bytes + excluded.total_size_bytes
+'''
 
 class SortingStats:
     """
@@ -17,14 +56,39 @@ class SortingStats:
     """
     def __init__(self):
         self.logger = logging.getLogger("SortingStats")
-        self.db_path = Path.home() / ".sortify" / "statistics.db"
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = SORTIFY_DIR / "statistics.db"
+        # One long-lived connection instead of a connect/close per call;
+        # recording happens from worker threads, so the lock serializes
+        # access to it
+        self._conn = None
+        self._lock = threading.Lock()
         self._init_db()
-        
+        # Records are queued and committed in batches by a background
+        # writer, so a bulk sort pays one commit fsync per batch instead
+        # of one per file
+        self._write_q = queue.Queue()
+        self._since_prune = 0
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+        atexit.register(self.flush)
+
+    def _connect(self):
+        """Open the shared connection and apply the performance pragmas"""
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                               cached_statements=256)
+        # WAL keeps readers unblocked during writes; synchronous=NORMAL
+        # drops the per-commit fsync to a WAL append (safe with WAL)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
+
     def _init_db(self):
         """Initialize the SQLite database for statistics storage"""
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            self._conn = self._connect()
+            conn = self._conn
             cursor = conn.cursor()
             
             # Create tables if they don't exist
@@ -35,7 +99,7 @@ class SortingStats:
                     file_path TEXT,
                     category TEXT,
                     size_bytes INTEGER,
-                    timestamp TIMESTAMP,
+                    timestamp INTEGER,
                     destination_path TEXT
                 )
             ''')
@@ -50,112 +114,235 @@ class SortingStats:
                     total_size_bytes INTEGER
                 )
             ''')
-            
+
+            # Indexes backing the timestamp range scans in the query
+            # methods and the per-file (date, category) summary probe;
+            # without them every dashboard refresh full-scans the tables
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_sorted_ts
+                ON sorted_files(timestamp)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_sorted_cat_ts
+                ON sorted_files(category, timestamp)
+            ''')
+
+            # Migrate ISO-string timestamps written before the epoch-integer
+            # change: SQLite orders all TEXT above all INTEGER, so without
+            # this the legacy rows would permanently outrank every new row
+            # in ORDER BY timestamp DESC. The old strings were local time
+            # (datetime.now().isoformat()); the 'utc' modifier tells
+            # strftime to convert from localtime before taking the epoch,
+            # matching the datetime.fromtimestamp reads
+            cursor.execute('''
+                UPDATE sorted_files
+                SET timestamp = CAST(strftime('%s', timestamp, 'utc') AS INTEGER)
+                WHERE typeof(timestamp) = 'text'
+            ''')
+
+            self._ensure_summary_unique_index(cursor)
+            self._ensure_monthly_rollup(cursor)
+
             conn.commit()
-            conn.close()
         except Exception as e:
-            self.logger.error(f"Failed to initialize stats database: {e}")
+            self.logger.error("Failed to initialize stats database: %s", e)
+
+    def _ensure_summary_unique_index(self, cursor):
+        """Create the unique (date, category) index the UPSERT relies on.
+
+        Databases written by the old SELECT-then-INSERT path can contain
+        duplicate summary rows; those are folded together before retrying
+        the index creation.
+        """
+        cursor.execute('DROP INDEX IF EXISTS idx_summary_date_cat')
+        try:
+            cursor.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS ux_summary_date_cat
+                ON stats_summary(date, category)
+            ''')
+        except sqlite3.IntegrityError:
+            cursor.execute('''
+                UPDATE stats_summary SET
+                    count = (SELECT SUM(s.count) FROM stats_summary s
+                             WHERE s.date = stats_summary.date
+                               AND s.category = stats_summary.category),
+                    total_size_bytes = (SELECT SUM(s.total_size_bytes) FROM stats_summary s
+                                        WHERE s.date = stats_summary.date
+                                          AND s.category = stats_summary.category)
+                WHERE id IN (SELECT MIN(id) FROM stats_summary
+                             GROUP BY date, category)
+            ''')
+            cursor.execute('''
+                DELETE FROM stats_summary WHERE id NOT IN (
+                    SELECT MIN(id) FROM stats_summary GROUP BY date, category)
+            ''')
+            cursor.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS ux_summary_date_cat
+                ON stats_summary(date, category)
+            ''')
     
-    def record_sorted_file(self, file_path, category, destination_path):
-        """Record a sorted file in the statistics database"""
+    def _ensure_monthly_rollup(self, cursor):
+        """Create the monthly rollup table, backfilling it from the daily
+        summary the first time so databases written before the rollup
+        existed chart their history correctly."""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS stats_monthly (
+                month TEXT,
+                category TEXT,
+                count INTEGER,
+                total_size_bytes INTEGER,
+                PRIMARY KEY (month, category)
+            )
+        ''')
+        cursor.execute('SELECT EXISTS(SELECT 1 FROM stats_monthly)')
+        if not cursor.fetchone()[0]:
+            cursor.execute('''
+                INSERT INTO stats_monthly (month, category, count, total_size_bytes)
+                SELECT substr(date, 1, 7), category, SUM(count), SUM(total_size_bytes)
+                FROM stats_summary
+                GROUP BY substr(date, 1, 7), category
+            ''')
+
+    def record_sorted_file(self, file_path, category, destination_path, size_bytes=None):
+        """Queue a sorted-file record for the background writer.
+
+        Returns as soon as the record is queued; the writer batches
+        queued records into a single transaction. Callers that already
+        stat'ed the file should pass size_bytes -- by the time this runs
+        the source path has been moved away, so statting it here would
+        record zero.
+        """
         try:
             file_path = Path(file_path)
-            size_bytes = file_path.stat().st_size if file_path.exists() else 0
+            if size_bytes is None:
+                # The destination is the post-move home of the file
+                destination = Path(destination_path)
+                size_bytes = destination.stat().st_size if destination.exists() else 0
             timestamp = datetime.now()
-            date = timestamp.date()
-            
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            # Record the sorted file
-            cursor.execute('''
-                INSERT INTO sorted_files 
-                (file_name, file_path, category, size_bytes, timestamp, destination_path) 
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (file_path.name, str(file_path), category, size_bytes, timestamp, str(destination_path)))
-            
-            # Check if we have a summary entry for this date and category
-            cursor.execute('''
-                SELECT id, count, total_size_bytes FROM stats_summary 
-                WHERE date = ? AND category = ?
-            ''', (date.isoformat(), category))
-            
-            row = cursor.fetchone()
-            if row:
-                # Update existing summary
-                cursor.execute('''
-                    UPDATE stats_summary SET 
-                    count = ?, total_size_bytes = ?
-                    WHERE id = ?
-                ''', (row[1] + 1, row[2] + size_bytes, row[0]))
-            else:
-                # Create new summary entry
-                cursor.execute('''
-                    INSERT INTO stats_summary
-                    (date, category, count, total_size_bytes)
-                    VALUES (?, ?, ?, ?)
-                ''', (date.isoformat(), category, 1, size_bytes))
-            
-            conn.commit()
-            conn.close()
-            
+
+            self._write_q.put((file_path.name, str(file_path), category, size_bytes,
+                               int(timestamp.timestamp()), str(destination_path),
+                               timestamp.date().isoformat()))
             return True
         except Exception as e:
-            self.logger.error(f"Failed to record sorted file stats: {e}")
+            self.logger.error("Failed to record sorted file stats: %s", e)
             return False
+
+    def flush(self):
+        """Block until every queued record has been committed"""
+        self._write_q.join()
+
+    def _writer_loop(self):
+        """Drain the record queue, committing batches in one transaction"""
+        while True:
+            batch = [self._write_q.get()]
+            deadline = time.monotonic() + BATCH_WINDOW_SECONDS
+            while len(batch) < BATCH_MAX_RECORDS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                self.logger.error("Failed to record sorted file stats: %s", e)
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+
+    def _write_batch(self, batch):
+        """Commit a batch of queued records in a single transaction"""
+        with self._lock:
+            cursor = self._conn.cursor()
+
+            # Take the write lock up front for the whole batch rather than
+            # letting the first statement start a deferred transaction that
+            # upgrades mid-way
+            cursor.execute("BEGIN IMMEDIATE")
+
+            # Record the sorted files; timestamps are stored as integer
+            # epoch seconds so index range scans compare natively
+            cursor.executemany(_SQL_INSERT_FILE, [record[:6] for record in batch])
+
+            # Ring-buffer retention: periodically trim the per-file history
+            # so the database stays bounded over the tray process lifetime
+            self._since_prune += len(batch)
+            if self._since_prune >= PRUNE_INTERVAL:
+                self._since_prune = 0
+                cursor.execute('''
+                    DELETE FROM sorted_files
+                    WHERE id <= (SELECT MAX(id) FROM sorted_files) - ?
+                ''', (MAX_SORTED_FILES_ROWS,))
+
+            # Maintain the (date, category) summary in one statement per
+            # record; the unique index makes the conflict target an index seek
+            cursor.executemany(_SQL_UPSERT_SUMMARY,
+                               [(record[6], record[2], record[3]) for record in batch])
+
+            # Second-level rollup: SUM and COUNT compose, so the monthly
+            # table is maintained with the same UPSERT and get_monthly_stats
+            # reads ~one row per month instead of ~thirty
+            cursor.executemany(_SQL_UPSERT_MONTHLY,
+                               [(record[6][:7], record[2], record[3]) for record in batch])
+
+            self._conn.commit()
     
     def get_recent_activity(self, limit=10):
         """Get the most recently sorted files"""
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT file_name, category, timestamp 
-                FROM sorted_files
-                ORDER BY timestamp DESC
-                LIMIT ?
-            ''', (limit,))
-            
+            # Make queued-but-uncommitted records visible to the query
+            self.flush()
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute('''
+                    SELECT file_name, category, timestamp
+                    FROM sorted_files
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                ''', (limit,))
+                rows = cursor.fetchmany(limit)
+
             results = []
-            for row in cursor.fetchall():
-                file_time = datetime.fromisoformat(row['timestamp'])
-                time_ago = self._format_time_ago(file_time)
-                
+            now = datetime.now()
+            for file_name, category, raw in rows:
+                # Timestamps are always integers after the _init_db migration
+                file_time = datetime.fromtimestamp(raw)
+                time_ago = self._format_time_ago(file_time, now)
+
                 results.append({
-                    'filename': row['file_name'],
-                    'category': row['category'],
+                    'filename': file_name,
+                    'category': category,
                     'time_ago': time_ago,
                     'timestamp': file_time
                 })
-                
-            conn.close()
+
             return results
         except Exception as e:
-            self.logger.error(f"Failed to get recent activity: {e}")
+            self.logger.error("Failed to get recent activity: %s", e)
             return []
     
     def get_total_stats(self):
         """Get overall statistics about sorted files"""
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
-            # Total files sorted
-            cursor.execute('SELECT COUNT(*) FROM sorted_files')
-            total_files = cursor.fetchone()[0] or 0
-            
-            # Total size of sorted files
-            cursor.execute('SELECT SUM(size_bytes) FROM sorted_files')
-            total_size = cursor.fetchone()[0] or 0
-            
-            # Count categories
-            cursor.execute('SELECT COUNT(DISTINCT category) FROM sorted_files')
-            category_count = cursor.fetchone()[0] or 0
-            
-            conn.close()
-            
+            self.flush()
+            # The pre-aggregated summary has one row per day and category
+            # (and, unlike the pruned sorted_files history, covers the
+            # full lifetime), so totals come from one tiny scan
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute('''
+                    SELECT SUM(count), SUM(total_size_bytes), COUNT(DISTINCT category)
+                    FROM stats_summary
+                ''')
+                row = cursor.fetchone()
+
+            total_files = row[0] or 0
+            total_size = row[1] or 0
+            category_count = row[2] or 0
+
             return {
                 'total_files': total_files,
                 'total_size': self._format_size(total_size),
@@ -163,7 +350,7 @@ class SortingStats:
                 'category_count': category_count
             }
         except Exception as e:
-            self.logger.error(f"Failed to get total stats: {e}")
+            self.logger.error("Failed to get total stats: %s", e)
             return {
                 'total_files': 0,
                 'total_size': '0 B',
@@ -174,9 +361,7 @@ class SortingStats:
     def get_category_distribution(self, time_range='month'):
         """Get file distribution by category within the specified time range"""
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
+            self.flush()
             # Calculate date range
             end_date = datetime.now()
             if time_range == 'week':
@@ -188,114 +373,137 @@ class SortingStats:
             else:
                 start_date = end_date - timedelta(days=30)  # Default to month
             
-            # Query data
-            cursor.execute('''
-                SELECT category, COUNT(*) as count, SUM(size_bytes) as total_size
-                FROM sorted_files
-                WHERE timestamp BETWEEN ? AND ?
-                GROUP BY category
-                ORDER BY count DESC
-            ''', (start_date, end_date))
-            
+            # Aggregate over the day-level summary rather than the raw
+            # per-file history: rows scanned scale with days x categories
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute('''
+                    SELECT category, SUM(count) as count, SUM(total_size_bytes) as total_size
+                    FROM stats_summary
+                    WHERE date BETWEEN ? AND ?
+                    GROUP BY category
+                    ORDER BY count DESC
+                ''', (start_date.date().isoformat(), end_date.date().isoformat()))
+                rows = cursor.fetchall()
+
             results = []
-            for row in cursor.fetchall():
+            for row in rows:
                 results.append({
                     'category': row[0],
                     'count': row[1],
                     'size': self._format_size(row[2]),
                     'size_bytes': row[2] or 0
                 })
-                
-            conn.close()
+
             return results
         except Exception as e:
-            self.logger.error(f"Failed to get category distribution: {e}")
+            self.logger.error("Failed to get category distribution: %s", e)
             return []
     
     def get_monthly_stats(self, months=6):
         """Get monthly statistics for the chart"""
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            
+            self.flush()
             # Calculate months to include
             end_date = datetime.now()
             start_date = end_date - timedelta(days=30*months)
-            
-            # Get monthly data
-            cursor.execute('''
-                SELECT 
-                    strftime('%Y-%m', timestamp) as month,
-                    category,
-                    COUNT(*) as count
-                FROM sorted_files
-                WHERE timestamp BETWEEN ? AND ?
-                GROUP BY month, category
-                ORDER BY month
-            ''', (start_date, end_date))
-            
-            results = defaultdict(lambda: defaultdict(int))
-            for row in cursor.fetchall():
-                month = row[0]  # Format: '2023-04'
-                category = row[1]
-                count = row[2]
-                
-                results[month][category] = count
-                
-            conn.close()
-            
-            # Convert to the required format for charting
+
+            start_month = start_date.strftime('%Y-%m')
+            end_month = end_date.strftime('%Y-%m')
+
+            # A recursive CTE enumerates the month window inside SQLite and
+            # left-joins the monthly rollup onto it, so missing months come
+            # back as NULL rows and no Python zero-fill pass is needed; the
+            # rollup keeps this to ~one row per month and category
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute('''
+                    WITH RECURSIVE months(month) AS (
+                        SELECT ?
+                        UNION ALL
+                        SELECT strftime('%Y-%m', date(month || '-01', '+1 month'))
+                        FROM months WHERE month < ?
+                    )
+                    SELECT months.month, s.category, s.count
+                    FROM months
+                    LEFT JOIN stats_monthly s ON s.month = months.month
+                    ORDER BY months.month
+                ''', (start_month, end_month))
+                rows = cursor.fetchall()
+
+            # Single pass: rows arrive month-ordered, empty months as a
+            # lone NULL-category row
             months_list = []
-            current = start_date
-            while current <= end_date:
-                month_key = current.strftime('%Y-%m')
-                months_list.append({
-                    'month': current.strftime('%b %Y'),
-                    'month_key': month_key,
-                    'categories': dict(results[month_key])
-                })
-                
-                # Advance to next month
-                if current.month == 12:
-                    current = datetime(current.year + 1, 1, 1)
-                else:
-                    current = datetime(current.year, current.month + 1, 1)
-            
+            current = None
+            for month_key, category, count in rows:
+                if current is None or current['month_key'] != month_key:
+                    year, month_num = map(int, month_key.split('-'))
+                    current = {
+                        'month': datetime(year, month_num, 1).strftime('%b %Y'),
+                        'month_key': month_key,
+                        'categories': {}
+                    }
+                    months_list.append(current)
+                if category is not None:
+                    current['categories'][category] = count
+
             return months_list
         except Exception as e:
-            self.logger.error(f"Failed to get monthly stats: {e}")
+            self.logger.error("Failed to get monthly stats: %s", e)
             return []
     
-    def _format_time_ago(self, timestamp):
-        """Format a timestamp as a human-readable time ago string"""
-        now = datetime.now()
-        diff = now - timestamp
-        
-        if diff.days > 365:
-            years = diff.days // 365
-            return f"{years} {'year' if years == 1 else 'years'} ago"
-        elif diff.days > 30:
-            months = diff.days // 30
-            return f"{months} {'month' if months == 1 else 'months'} ago"
-        elif diff.days > 0:
-            return f"{diff.days} {'day' if diff.days == 1 else 'days'} ago"
-        elif diff.seconds > 3600:
-            hours = diff.seconds // 3600
-            return f"{hours} {'hour' if hours == 1 else 'hours'} ago"
-        elif diff.seconds > 60:
-            minutes = diff.seconds // 60
-            return f"{minutes} {'minute' if minutes == 1 else 'minutes'} ago"
-        else:
-            return "just now"
+    # Unit table for _format_time_ago: (seconds per unit, singular, plural),
+    # largest first
+    _AGO_TABLE = (
+        (31536000, 'year', 'years'),
+        (2592000, 'month', 'months'),
+        (86400, 'day', 'days'),
+        (3600, 'hour', 'hours'),
+        (60, 'minute', 'minutes'),
+    )
+
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+    def _format_time_ago(self, timestamp, now=None):
+        """Format a timestamp as a human-readable time ago string.
+
+        Callers formatting many rows pass now once instead of paying a
+        datetime.now() per row.
+        """
+        if now is None:
+            now = datetime.now()
+        total_seconds = (now - timestamp).total_seconds()
+
+        for unit_seconds, singular, plural in self._AGO_TABLE:
+            count = int(total_seconds // unit_seconds)
+            if count >= 1:
+                return f"{count} {singular if count == 1 else plural} ago"
+        return "just now"
     
     def _format_size(self, size_bytes):
         """Format a file size in bytes to a human-readable format"""
-        if size_bytes is None:
+        if not size_bytes:
             return "0 B"
-            
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024 or unit == 'TB':
-                if unit == 'B':
-                    return f"{size_bytes} {unit}"
-                return f"{size_bytes:.2f} {unit}".rstrip('0').rstrip('.') + ' ' + unit
-            size_bytes /= 1024.0
\ No newline at end of file
+
+        # Unit index straight from the bit length: each 1024 step is 10 bits
+        idx = min((int(size_bytes).bit_length() - 1) // 10, len(self._SIZE_UNITS) - 1)
+        if idx == 0:
+            return f"{size_bytes} B"
+        value = size_bytes / (1 << (idx * 10))
+        return f"{value:.2f}".rstrip('0').rstrip('.') + ' ' + self._SIZE_UNITS[idx]
+
+
+# Process-wide shared instance: SortingStats owns a persistent connection,
+# a background writer thread and an atexit hook, so constructing one per
+# FileSorter would leak all three on every scheduled scan
+_shared_stats = None
+_shared_stats_lock = threading.Lock()
+
+def get_stats():
+    """Return the process-wide SortingStats instance, creating it on first use"""
+    global _shared_stats
+    if _shared_stats is None:
+        with _shared_stats_lock:
+            if _shared_stats is None:
+                _shared_stats = SortingStats()
+    return _shared_stats
\ No newline at end of file
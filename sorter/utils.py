@@ -2,46 +2,95 @@
 Utility functions for the Downloads Sorter application.
 """
 import os
+import copy
 import json
+import atexit
 import logging
+import logging.handlers
 from pathlib import Path
 
+# Default Downloads folder, resolved once at import instead of per call site
+DEFAULT_DOWNLOADS = str(Path.home() / "Downloads")
+
+# Application data directory (config, statistics db, log), created once at
+# import so the per-call mkdir syscalls in the accessors go away
+SORTIFY_DIR = Path.home() / ".sortify"
+SORTIFY_DIR.mkdir(parents=True, exist_ok=True)
+
+# orjson is an optional accelerator for config parsing on the startup
+# path; the stdlib json fallback keeps the file format identical
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
 def setup_logging():
     """Configure logging for the application"""
-    log_file = Path.home() / ".sortify" / "downloads_sorter.log"
-    
-    # Create log directory if it doesn't exist
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    
+    log_file = SORTIFY_DIR / "downloads_sorter.log"
+
+    # delay=True defers opening the file until something is logged; the
+    # memory handler buffers routine records so a burst sort issues one
+    # write per 256 records instead of one per record (errors flush
+    # immediately, and an atexit hook drains the tail)
+    file_handler = logging.FileHandler(str(log_file), delay=True)
+    file_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.ERROR, target=file_handler)
+    atexit.register(memory_handler.flush)
+
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(str(log_file)),
+            memory_handler,
             logging.StreamHandler()
         ]
     )
-    
+
     return logging.getLogger("sortify")
 
 def get_config_path():
     """Get the path to the configuration file"""
-    config_dir = Path.home() / ".sortify"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    
-    return config_dir / "config.json"
+    return SORTIFY_DIR / "config.json"
+
+# Parsed-config cache keyed by (path, st_mtime_ns); avoids re-reading and
+# re-parsing the file for every FileSorter/DownloadHandler construction
+_config_cache = {"key": None, "config": None}
 
 def load_config():
     """Load configuration from the config file"""
     config_path = get_config_path()
-    
+
     # Create default config if it doesn't exist
     if not config_path.exists():
         create_default_config()
-        
+
+    try:
+        cache_key = (str(config_path), os.stat(config_path).st_mtime_ns)
+    except OSError:
+        cache_key = None
+
+    if cache_key is not None and _config_cache["key"] == cache_key:
+        # Deep-copy so callers can mutate their config independently, as
+        # they could when every load re-parsed the file
+        return copy.deepcopy(_config_cache["config"])
+
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        config = _json_loads(config_path.read_bytes())
+        _config_cache["key"] = cache_key
+        _config_cache["config"] = copy.deepcopy(config)
+        return config
     except Exception as e:
         logging.error(f"Error loading config: {e}")
         # Return default config if loading fails
@@ -50,10 +99,15 @@ def load_config():
 def save_config(config):
     """Save configuration to the config file"""
     config_path = get_config_path()
-    
+
     try:
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Write to a sibling temp file and rename into place, so a crash
+        # mid-write can never leave a truncated config behind
+        tmp_path = config_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_json_dumps(config))
+        os.replace(tmp_path, config_path)
+        # Drop the cached parse; the next load picks up the new contents
+        _config_cache["key"] = None
         return True
     except Exception as e:
         logging.error(f"Error saving config: {e}")
@@ -61,7 +115,7 @@ def save_config(config):
 
 def create_default_config():
     """Create and return default configuration"""
-    downloads_path = str(Path.home() / "Downloads")
+    downloads_path = DEFAULT_DOWNLOADS
     
     default_config = {
         "source_folder": downloads_path,
@@ -79,23 +133,53 @@ def create_default_config():
         "exclusions": ["partial", ".crdownload", ".part", ".tmp"],
         "min_file_size": 1024,  # 1KB
         "sort_delay": 5,  # 5 seconds
-        "show_notifications": True
+        "show_notifications": True,
+        "monitor_backend": "auto",  # auto / native / poll
+        "poll_interval": 3,  # seconds, used when polling backend is active
+        "max_concurrent_moves": 8  # worker threads for bulk sorts (1 = serial)
     }
     
     # Save the default configuration
     config_path = get_config_path()
     try:
-        with open(config_path, 'w') as f:
-            json.dump(default_config, f, indent=2)
+        tmp_path = config_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_json_dumps(default_config))
+        os.replace(tmp_path, config_path)
     except Exception as e:
         logging.error(f"Error creating default config: {e}")
         
     return default_config
 
+def get_extension_map(config):
+    """Invert the config's category -> extensions mapping.
+
+    Returns an extension -> category dict for O(1) lookups on the sort
+    path. Callers should memoize against their config instance rather
+    than rebuilding per file.
+    """
+    return {
+        ext.lower(): name
+        for name, extensions in config.get("categories", {}).items()
+        for ext in extensions
+    }
+
+# Cached startup-registration state; the registry is only consulted once
+# and re-read is unnecessary because set_run_at_startup is the only writer
+_startup_cache = None
+
 def is_running_at_startup():
     """Check if the app is configured to run at Windows startup"""
+    global _startup_cache
+    if _startup_cache is not None:
+        return _startup_cache
+
+    _startup_cache = _read_startup_registration()
+    return _startup_cache
+
+def _read_startup_registration():
+    """Read the Run key to see whether the startup entry exists"""
     import winreg
-    
+
     try:
         key = winreg.OpenKey(
             winreg.HKEY_CURRENT_USER,
@@ -115,9 +199,10 @@ def is_running_at_startup():
 
 def set_run_at_startup(enable=True):
     """Configure the application to run at Windows startup"""
+    global _startup_cache
     import winreg
     import sys
-    
+
     run_key = r"Software\Microsoft\Windows\CurrentVersion\Run"
     app_name = "SortifyDownloadSorter"
     
@@ -144,6 +229,7 @@ def set_run_at_startup(enable=True):
                 pass
                 
         winreg.CloseKey(key)
+        _startup_cache = enable
         return True
     except Exception as e:
         logging.error(f"Error setting startup: {e}")
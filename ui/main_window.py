@@ -1,41 +1,115 @@
 """
 Main window for Downloads Sorter application.
 """
-import os
-import sys
+import functools
+import heapq
+from collections import Counter
 from pathlib import Path
-from PIL import Image
 from datetime import datetime
 import threading
-import math
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QPushButton, QLabel,
     QVBoxLayout, QHBoxLayout, QFrame, QScrollArea, QFileDialog,
-    QCheckBox, QRadioButton, QLineEdit, QMessageBox, QSplitter,
-    QGridLayout, QStackedWidget, QComboBox
+    QCheckBox, QRadioButton, QLineEdit, QMessageBox,
+    QGridLayout, QStackedWidget, QComboBox, QInputDialog, QSystemTrayIcon
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSlot, QTimer
-from PyQt6.QtGui import QIcon, QFont, QPixmap, QColor, QPalette, QPainter
+from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer
+from PyQt6.QtGui import QIcon, QFont, QPixmap, QColor, QPainter
 from PyQt6.QtCharts import QChart, QChartView, QPieSeries, QBarSeries, QBarSet, QBarCategoryAxis, QValueAxis
 
+# Optional: OS dark-mode detection for the "System" appearance setting
+try:
+    import darkdetect
+except ImportError:
+    darkdetect = None
+
 from sorter.file_sorter import FileSorter
-from sorter.stats import SortingStats
-from sorter.utils import load_config, save_config
+from sorter.stats import get_stats
+from sorter.utils import load_config, save_config, set_run_at_startup, DEFAULT_DOWNLOADS
 from .tray_icon import SortifyTrayIcon
 
+# Slice/bar palette shared by both charts; resolved to QColor once at
+# import instead of re-parsing the hex strings on every redraw
+CHART_COLORS = tuple(QColor(c) for c in (
+    '#3498db', '#2ecc71', '#e74c3c', '#f39c12',
+    '#9b59b6', '#1abc9c', '#34495e', '#7f8c8d',
+))
+
+# Shared sidebar navigation button styling
+NAV_BUTTON_STYLE = "text-align: left; padding: 10px;"
+NAV_ICON_SIZE = QSize(20, 20)
+
+def flat_icon(color, size=20):
+    """Build a solid-color placeholder icon, cached per (color, size, DPI).
+
+    The pixmap is rendered at the screen's device pixel ratio so Qt
+    paints it 1:1 on HiDPI displays instead of rescaling on every draw.
+    """
+    app = QApplication.instance()
+    dpr = app.devicePixelRatio() if app is not None else 1.0
+    return _flat_icon(color, size, dpr)
+
+@functools.lru_cache(maxsize=16)
+def _flat_icon(color, size, dpr):
+    pixmap = QPixmap(int(size * dpr), int(size * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(QColor(color))
+    return QIcon(pixmap)
+
+@functools.lru_cache(maxsize=32)
+def file_icon(path):
+    """Load an icon file once per process; re-opening the window (e.g. from
+    the tray) reuses the decoded pixmap instead of re-reading the PNG"""
+    return QIcon(path)
+
 class MainWindow(QMainWindow):
     """Main window class for Downloads Sorter application"""
-    def __init__(self, file_monitor=None):
+
+    # Emitted from the worker thread when a manual sort completes
+    sort_finished = pyqtSignal(int, int)
+
+    # Emitted from worker threads once the stats queries behind a refresh
+    # have finished, carrying the query results to the UI thread
+    dashboard_data_ready = pyqtSignal(object, object)
+    statistics_data_ready = pyqtSignal(object, object)
+
+    def __init__(self, file_monitor=None, enable_tray=True):
         super().__init__()
-        
+
         self.file_monitor = file_monitor
+        self.enable_tray = enable_tray
         self.config = load_config()
         self.sorter = FileSorter()
-        self.stats = SortingStats()
+        # Same instance the sorters record into, so flush() before the
+        # dashboard queries drains the batch that a sort just queued
+        self.stats = get_stats()
         self.tray_icon = None
         self.is_closing = False
+        self._applied_theme = None
         self.current_time_range = "month"  # Default time range for statistics
+        # Most recent sort time for the status bar, refreshed by the
+        # dashboard worker and on sort completion so status updates never
+        # query the database on the UI thread
+        self._last_sort_str = "Never"
+
+        # Lets show_statistics skip the stats queries when nothing has
+        # been sorted since the page was last populated; the initial page
+        # build refreshes itself, so it starts clean
+        self._stats_dirty = False
+
+        # Query results per time range; toggling back to an already-viewed
+        # range reuses them instead of re-running the aggregate queries.
+        # Cleared on manual sorts and settings changes, and each entry is
+        # validated against the total-files counter before use so sorts by
+        # the background monitor invalidate it too.
+        self._stats_data_cache = {}
+
+        # Coalesces rapid time-range changes into one chart redraw
+        self._stats_refresh_timer = QTimer(self)
+        self._stats_refresh_timer.setSingleShot(True)
+        self._stats_refresh_timer.setInterval(50)
+        self._stats_refresh_timer.timeout.connect(self.refresh_statistics)
         
         # Configure window
         self.setWindowTitle("Sortify - Downloads Sorter")
@@ -51,6 +125,12 @@ class MainWindow(QMainWindow):
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
         
+        # Marshal query results from worker threads back to the UI thread;
+        # connected before the frames are built because the dashboard kicks
+        # off its first refresh during construction
+        self.dashboard_data_ready.connect(self._apply_dashboard_data)
+        self.statistics_data_ready.connect(self._apply_statistics_data)
+
         # Load icons and resources
         self.load_resources()
         
@@ -71,6 +151,9 @@ class MainWindow(QMainWindow):
             # Apply the theme
             self.change_appearance_mode(saved_theme)
         
+        # Marshal sort results from the worker thread back to the UI thread
+        self.sort_finished.connect(self._on_sort_finished)
+
         # Initialize system tray
         self.initialize_tray()
 
@@ -79,6 +162,10 @@ class MainWindow(QMainWindow):
         if self.is_closing:
             # If we're actually closing the app, accept the event
             event.accept()
+        elif self.tray_icon is None:
+            # No tray to minimize into, so closing the window quits
+            self.quit_app()
+            event.accept()
         else:
             # Otherwise, hide the window and reject the close event
             self.hide()
@@ -86,6 +173,11 @@ class MainWindow(QMainWindow):
             
     def initialize_tray(self):
         """Initialize the system tray icon"""
+        # Skipped when disabled (--no-tray) or when the platform has no
+        # tray to attach to; closing the window then quits instead of
+        # hiding into a tray that doesn't exist
+        if not self.enable_tray or not QSystemTrayIcon.isSystemTrayAvailable():
+            return
         self.tray_icon = SortifyTrayIcon(self, self.file_monitor)
         self.tray_icon.run()
 
@@ -108,24 +200,21 @@ class MainWindow(QMainWindow):
         
     def load_resources(self):
         """Load icons and resources"""
+        # Shared fonts - constructed once and reused by every label instead
+        # of allocating a fresh QFont per widget
+        self.font_logo = QFont("Arial", 20, QFont.Weight.Bold)
+        self.font_h1 = QFont("Arial", 24, QFont.Weight.Bold)
+        self.font_h2 = QFont("Arial", 16, QFont.Weight.Bold)
+        self.font_body = QFont("Arial", 14)
+        self.font_label_bold = QFont("Arial", QFont.Weight.Bold)
+
         resource_dir = Path(__file__).parent / "resources"
         
-        # Default to creating simple pixmaps if resources are not available
-        dashboard_pixmap = QPixmap(20, 20)
-        dashboard_pixmap.fill(QColor("#3498db"))
-        self.dashboard_icon = QIcon(dashboard_pixmap)
-        
-        settings_pixmap = QPixmap(20, 20)
-        settings_pixmap.fill(QColor("#2ecc71"))
-        self.settings_icon = QIcon(settings_pixmap)
-        
-        stats_pixmap = QPixmap(20, 20)
-        stats_pixmap.fill(QColor("#e74c3c"))
-        self.stats_icon = QIcon(stats_pixmap)
-        
-        folder_pixmap = QPixmap(20, 20)
-        folder_pixmap.fill(QColor("#f39c12"))
-        self.folder_icon = QIcon(folder_pixmap)
+        # Default to simple flat-color icons (cached) if resources are missing
+        self.dashboard_icon = flat_icon("#3498db")
+        self.settings_icon = flat_icon("#2ecc71")
+        self.stats_icon = flat_icon("#e74c3c")
+        self.folder_icon = flat_icon("#f39c12")
         
         # Try to load actual icons if they exist
         try:
@@ -139,14 +228,7 @@ class MainWindow(QMainWindow):
                 
                 for name, path in icon_files.items():
                     if path.exists():
-                        if name == "dashboard":
-                            self.dashboard_icon = QIcon(str(path))
-                        elif name == "settings":
-                            self.settings_icon = QIcon(str(path))
-                        elif name == "stats":
-                            self.stats_icon = QIcon(str(path))
-                        elif name == "folder":
-                            self.folder_icon = QIcon(str(path))
+                        setattr(self, f"{name}_icon", file_icon(str(path)))
         except Exception as e:
             print(f"Error loading resources: {e}")
         
@@ -164,35 +246,16 @@ class MainWindow(QMainWindow):
         
         # App logo and title
         self.logo_label = QLabel("Sortify")
-        self.logo_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        self.logo_label.setFont(self.font_logo)
         self.logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.logo_label.setContentsMargins(0, 20, 0, 20)
         self.sidebar_layout.addWidget(self.logo_label)
         
-        # Navigation buttons
-        self.nav_dashboard = QPushButton("Dashboard")
-        self.nav_dashboard.setIcon(self.dashboard_icon)
-        self.nav_dashboard.setIconSize(QSize(20, 20))
-        self.nav_dashboard.setFlat(True)
-        self.nav_dashboard.setStyleSheet("text-align: left; padding: 10px;")
-        self.nav_dashboard.clicked.connect(self.show_dashboard)
-        self.sidebar_layout.addWidget(self.nav_dashboard)
-        
-        self.nav_stats = QPushButton("Statistics")
-        self.nav_stats.setIcon(self.stats_icon)
-        self.nav_stats.setIconSize(QSize(20, 20))
-        self.nav_stats.setFlat(True)
-        self.nav_stats.setStyleSheet("text-align: left; padding: 10px;")
-        self.nav_stats.clicked.connect(self.show_statistics)
-        self.sidebar_layout.addWidget(self.nav_stats)
-        
-        self.nav_settings = QPushButton("Settings")
-        self.nav_settings.setIcon(self.settings_icon)
-        self.nav_settings.setIconSize(QSize(20, 20))
-        self.nav_settings.setFlat(True)
-        self.nav_settings.setStyleSheet("text-align: left; padding: 10px;")
-        self.nav_settings.clicked.connect(self.show_settings)
-        self.sidebar_layout.addWidget(self.nav_settings)
+        # Navigation buttons share one factory instead of repeating the
+        # same five configure calls per button
+        self.nav_dashboard = self._make_nav_button("Dashboard", self.dashboard_icon, self.show_dashboard)
+        self.nav_stats = self._make_nav_button("Statistics", self.stats_icon, self.show_statistics)
+        self.nav_settings = self._make_nav_button("Settings", self.settings_icon, self.show_settings)
         
         self.sidebar_layout.addStretch(1)
         
@@ -204,9 +267,14 @@ class MainWindow(QMainWindow):
         self.toggle_button.stateChanged.connect(self.toggle_service)
         self.control_layout.addWidget(self.toggle_button)
 
-        # Set the initial state and text of the toggle based on whether the monitor is running
-        is_initially_running = self.file_monitor and self.file_monitor.is_running()
+        # Set the initial state and text of the toggle based on whether the
+        # monitor is running. Signals are blocked so reflecting the current
+        # state doesn't invoke toggle_service (which would redundantly poke
+        # the monitor and touch the not-yet-built status bar).
+        is_initially_running = bool(self.file_monitor and self.file_monitor.is_running())
+        self.toggle_button.blockSignals(True)
         self.toggle_button.setChecked(is_initially_running)
+        self.toggle_button.blockSignals(False)
         self.toggle_button.setText("Pause Monitoring" if is_initially_running else "Resume Monitoring") # Correct initial text
 
         # Appearance mode
@@ -217,7 +285,18 @@ class MainWindow(QMainWindow):
         
         self.sidebar_layout.addWidget(self.control_frame)
         self.main_layout.addWidget(self.sidebar_frame)
-                     
+
+    def _make_nav_button(self, text, icon, handler):
+        """Build one sidebar navigation button and add it to the sidebar"""
+        button = QPushButton(text)
+        button.setIcon(icon)
+        button.setIconSize(NAV_ICON_SIZE)
+        button.setFlat(True)
+        button.setStyleSheet(NAV_BUTTON_STYLE)
+        button.clicked.connect(handler)
+        self.sidebar_layout.addWidget(button)
+        return button
+
     def create_main_content(self):
         """Create the main content area"""
         # Main frame with vertical layout to hold content and status bar
@@ -237,11 +316,12 @@ class MainWindow(QMainWindow):
         # Add the main area to the main layout
         self.main_layout.addWidget(self.main_area)
         
-        # Create all content frames
+        # Create the dashboard eagerly; statistics and settings are built
+        # lazily on first navigation to keep startup light
+        self.statistics_frame = None
+        self.settings_frame = None
         self.create_dashboard_frame()
-        self.create_statistics_frame()
-        self.create_settings_frame()
-        
+
         # Start with dashboard
         self.show_dashboard()
         
@@ -256,12 +336,12 @@ class MainWindow(QMainWindow):
         header_layout = QHBoxLayout(header)
         
         header_label = QLabel("Dashboard")
-        header_label.setFont(QFont("Arial", 24, QFont.Weight.Bold))
+        header_label.setFont(self.font_h1)
         header_layout.addWidget(header_label)
         
-        sort_now_btn = QPushButton("Sort Now")
-        sort_now_btn.clicked.connect(self.sort_now)
-        header_layout.addWidget(sort_now_btn)
+        self.sort_now_btn = QPushButton("Sort Now")
+        self.sort_now_btn.clicked.connect(self.sort_now)
+        header_layout.addWidget(self.sort_now_btn)
         
         dashboard_layout.addWidget(header)
         
@@ -273,7 +353,7 @@ class MainWindow(QMainWindow):
         activity_header_layout = QHBoxLayout(activity_header)
         
         activity_label = QLabel("Recent Activity")
-        activity_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        activity_label.setFont(self.font_h2)
         activity_header_layout.addWidget(activity_label)
         
         refresh_btn = QPushButton("Refresh")
@@ -282,12 +362,15 @@ class MainWindow(QMainWindow):
         
         activity_layout.addWidget(activity_header)
         
-        # Recent activity list (scrollable)
+        # Recent activity list (scrollable). Row widgets are created once and
+        # updated in place on refresh rather than destroyed and rebuilt.
         self.activity_list = QScrollArea()
         self.activity_list.setWidgetResizable(True)
         self.activity_list_content = QWidget()
         self.activity_list_layout = QVBoxLayout(self.activity_list_content)
         self.activity_list.setWidget(self.activity_list_content)
+        self._activity_items = []
+        self._activity_placeholder = None
         
         activity_layout.addWidget(self.activity_list)
         dashboard_layout.addWidget(activity_frame)
@@ -321,7 +404,7 @@ class MainWindow(QMainWindow):
         header_layout = QHBoxLayout(header)
         
         header_label = QLabel("Statistics")
-        header_label.setFont(QFont("Arial", 24, QFont.Weight.Bold))
+        header_label.setFont(self.font_h1)
         header_layout.addWidget(header_label)
         
         self.time_range_selector = QComboBox()
@@ -341,13 +424,24 @@ class MainWindow(QMainWindow):
         self.pie_layout = QVBoxLayout(self.pie_frame)
         
         pie_header = QLabel("Files by Category")
-        pie_header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        pie_header.setFont(self.font_h2)
         self.pie_layout.addWidget(pie_header)
         
         self.pie_chart_frame = QFrame()
         pie_chart_layout = QVBoxLayout(self.pie_chart_frame)
         self.pie_layout.addWidget(self.pie_chart_frame)
-        
+
+        # Persistent chart view and no-data label; refreshes swap the QChart
+        # on the view instead of recreating the (window-backed) widget
+        self.pie_chart_view = QChartView()
+        self.pie_chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pie_chart_layout.addWidget(self.pie_chart_view)
+        self.pie_message_label = QLabel()
+        self.pie_message_label.setFont(self.font_body)
+        self.pie_message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.pie_message_label.hide()
+        pie_chart_layout.addWidget(self.pie_message_label)
+
         charts_layout.addWidget(self.pie_frame)
         
         # Bar chart section
@@ -355,13 +449,22 @@ class MainWindow(QMainWindow):
         self.bar_layout = QVBoxLayout(self.bar_frame)
         
         bar_header = QLabel("Files Sorted by Month")
-        bar_header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        bar_header.setFont(self.font_h2)
         self.bar_layout.addWidget(bar_header)
         
         self.bar_chart_frame = QFrame()
         bar_chart_layout = QVBoxLayout(self.bar_chart_frame)
         self.bar_layout.addWidget(self.bar_chart_frame)
-        
+
+        self.bar_chart_view = QChartView()
+        self.bar_chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        bar_chart_layout.addWidget(self.bar_chart_view)
+        self.bar_message_label = QLabel()
+        self.bar_message_label.setFont(self.font_body)
+        self.bar_message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.bar_message_label.hide()
+        bar_chart_layout.addWidget(self.bar_message_label)
+
         charts_layout.addWidget(self.bar_frame)
         
         stats_layout.addWidget(charts_container)
@@ -380,7 +483,7 @@ class MainWindow(QMainWindow):
         header_layout = QHBoxLayout(header)
         
         header_label = QLabel("Settings")
-        header_label.setFont(QFont("Arial", 24, QFont.Weight.Bold))
+        header_label.setFont(self.font_h1)
         header_layout.addWidget(header_label)
         
         save_btn = QPushButton("Save")
@@ -401,7 +504,7 @@ class MainWindow(QMainWindow):
         folder_layout = QVBoxLayout(folder_section)
         
         folder_label = QLabel("Folder Settings")
-        folder_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        folder_label.setFont(self.font_h2)
         folder_layout.addWidget(folder_label)
         
         # Source folder
@@ -412,7 +515,7 @@ class MainWindow(QMainWindow):
         source_layout.addWidget(source_label)
         
         self.source_entry = QLineEdit()
-        self.source_entry.setText(self.config.get("source_folder", str(Path.home() / "Downloads")))
+        self.source_entry.setText(self.config.get("source_folder", DEFAULT_DOWNLOADS))
         source_layout.addWidget(self.source_entry)
         
         source_btn = QPushButton("Browse")
@@ -430,7 +533,7 @@ class MainWindow(QMainWindow):
         dest_layout.addWidget(dest_label)
         
         self.dest_entry = QLineEdit()
-        self.dest_entry.setText(self.config.get("destination_folder", str(Path.home() / "Downloads")))
+        self.dest_entry.setText(self.config.get("destination_folder", DEFAULT_DOWNLOADS))
         dest_layout.addWidget(self.dest_entry)
         
         dest_btn = QPushButton("Browse")
@@ -447,7 +550,7 @@ class MainWindow(QMainWindow):
         behavior_layout = QVBoxLayout(behavior_section)
         
         behavior_label = QLabel("Behavior")
-        behavior_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        behavior_label.setFont(self.font_h2)
         behavior_layout.addWidget(behavior_label)
         
         options_frame = QFrame()
@@ -460,15 +563,31 @@ class MainWindow(QMainWindow):
         self.notify_var = QCheckBox("Show notifications")
         self.notify_var.setChecked(self.config.get("show_notifications", True))
         options_layout.addWidget(self.notify_var)
-        
+
         behavior_layout.addWidget(options_frame)
+
+        # Monitoring backend selection (polling is needed for network mounts)
+        backend_frame = QFrame()
+        backend_layout = QHBoxLayout(backend_frame)
+
+        backend_label = QLabel("Monitoring backend:")
+        backend_layout.addWidget(backend_label)
+
+        self.backend_selector = QComboBox()
+        self.backend_selector.addItems(["Auto", "Native", "Poll"])
+        self.backend_selector.setCurrentText(self.config.get("monitor_backend", "auto").capitalize())
+        self.backend_selector.setToolTip("Use 'Poll' if your Downloads folder is on a network drive (SMB/NFS)")
+        backend_layout.addWidget(self.backend_selector)
+
+        backend_layout.addStretch()
+        behavior_layout.addWidget(backend_frame)
         
         # Scan schedule section
         schedule_frame = QFrame()
         schedule_layout = QVBoxLayout(schedule_frame)
         
         schedule_label = QLabel("Folder Scan Schedule:")
-        schedule_label.setFont(QFont("Arial", QFont.Weight.Bold))
+        schedule_label.setFont(self.font_label_bold)
         schedule_layout.addWidget(schedule_label)
         
         # Scan mode options
@@ -535,7 +654,7 @@ class MainWindow(QMainWindow):
         cats_header_layout = QHBoxLayout(cats_header)
         
         cats_label = QLabel("Categories")
-        cats_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        cats_label.setFont(self.font_h2)
         cats_header_layout.addWidget(cats_label)
                    
         add_cat_btn = QPushButton("Add Category")
@@ -544,9 +663,11 @@ class MainWindow(QMainWindow):
         
         categories_layout.addWidget(cats_header)
         
-        # Category list
+        # Category list; rows are tracked per category so refreshes can
+        # diff instead of rebuilding
         self.cat_list_frame = QFrame()
         self.cat_list_layout = QVBoxLayout(self.cat_list_frame)
+        self._cat_rows = {}
         
         categories_layout.addWidget(self.cat_list_frame)
         settings_layout.addWidget(categories_section)
@@ -564,7 +685,8 @@ class MainWindow(QMainWindow):
         self.status_layout = QHBoxLayout(self.status_bar)
         self.status_layout.setContentsMargins(10, 0, 10, 0)
         
-        self.status_label = QLabel("Ready | Last sort: Never")
+        self._status_text = "Ready | Last sort: Never"
+        self.status_label = QLabel(self._status_text)
         self.status_layout.addWidget(self.status_label)
         
         self.status_layout.addStretch()
@@ -574,17 +696,35 @@ class MainWindow(QMainWindow):
         
         self.main_layout.addWidget(self.status_bar)
 
+    def _set_status(self, text):
+        """Update the status bar, skipping the repaint when unchanged"""
+        if text == self._status_text:
+            return
+        self._status_text = text
+        self.status_label.setText(text)
+
     def refresh_categories(self):
-        """Refresh the categories list in settings"""
-        # Clear existing categories
-        for i in reversed(range(self.cat_list_layout.count())):
-            widget = self.cat_list_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.deleteLater()
-            
-        # Add categories from config
-        for i, (cat_name, extensions) in enumerate(self.config.get("categories", {}).items()):
-            self.create_category_item(self.cat_list_frame, cat_name, ", ".join(extensions), i)
+        """Refresh the categories list in settings.
+
+        Rows are diffed against the previous state: editing one category
+        touches one label instead of destroying and rebuilding every row.
+        """
+        categories = self.config.get("categories", {})
+
+        # Remove rows whose category no longer exists
+        for name in list(self._cat_rows):
+            if name not in categories:
+                frame, _ = self._cat_rows.pop(name)
+                frame.deleteLater()
+
+        # Create missing rows, update changed extension labels in place
+        for name, extensions in categories.items():
+            extensions_text = ", ".join(extensions)
+            row = self._cat_rows.get(name)
+            if row is None:
+                self.create_category_item(name, extensions_text)
+            elif row[1].text() != extensions_text:
+                row[1].setText(extensions_text)
 
     # Helper methods for UI components
     def create_stat_card(self, parent, title, value, column):
@@ -612,38 +752,21 @@ class MainWindow(QMainWindow):
         item.setFrameShape(QFrame.Shape.StyledPanel)
         item.setProperty("class", "activity-item")  # Apply activity-item styling
         item_layout = QVBoxLayout(item)
-        
-        # File info
-        info_frame = QFrame()
-        info_layout = QVBoxLayout(info_frame)
-        
+
+        # File info: one label for the name, one preformatted label for the
+        # details line instead of a nested frame with three labels
         filename_label = QLabel(filename)
         filename_label.setProperty("filename", "true")  # Set filename property for styling
-        info_layout.addWidget(filename_label)
-        
-        details_frame = QFrame()
-        details_layout = QHBoxLayout(details_frame)
-        details_layout.setContentsMargins(0, 0, 0, 0)
-        
-        category_label = QLabel(category)
-        category_label.setProperty("details", "true")  # Set details property for styling
-        details_layout.addWidget(category_label)
-                   
-        separator_label = QLabel(" • ")
-        separator_label.setProperty("details", "true")  # Set details property for styling
-        details_layout.addWidget(separator_label)
-                   
-        time_ago_label = QLabel(time_ago)
-        time_ago_label.setProperty("details", "true")  # Set details property for styling
-        details_layout.addWidget(time_ago_label)
-        
-        details_layout.addStretch()
-        
-        info_layout.addWidget(details_frame)
-        item_layout.addWidget(info_frame)
+        item_layout.addWidget(filename_label)
+
+        details_label = QLabel(f"{category} • {time_ago}")
+        details_label.setProperty("details", "true")  # Set details property for styling
+        item_layout.addWidget(details_label)
+
         self.activity_list_layout.addWidget(item)
+        self._activity_items.append((item, filename_label, details_label))
     
-    def create_category_item(self, parent, name, extensions, row):
+    def create_category_item(self, name, extensions):
         """Create a category item in settings"""
         frame = QFrame()
         frame.setFrameShape(QFrame.Shape.StyledPanel)
@@ -652,7 +775,7 @@ class MainWindow(QMainWindow):
         
         # Category name
         name_label = QLabel(name)
-        name_label.setFont(QFont("Arial", QFont.Weight.Bold))
+        name_label.setFont(self.font_label_bold)
         frame_layout.addWidget(name_label)
         
         # Extensions list        
@@ -666,36 +789,48 @@ class MainWindow(QMainWindow):
         edit_btn.setProperty("secondary", "true")  # Apply secondary button styling
         edit_btn.clicked.connect(lambda checked, n=name: self.edit_category(n))
         frame_layout.addWidget(edit_btn)
-        
+
         self.cat_list_layout.addWidget(frame)
+        self._cat_rows[name] = (frame, extensions_label)
         
     # UI navigation and action methods
+    def _set_active_nav(self, button):
+        """Highlight the active nav button, restyling only what changed"""
+        previous = getattr(self, "_active_nav", None)
+        if previous is button:
+            return
+        if previous is not None:
+            previous.setStyleSheet(NAV_BUTTON_STYLE)
+        button.setStyleSheet(NAV_BUTTON_STYLE + " background-color: lightgray;")
+        self._active_nav = button
+
     def show_dashboard(self):
         # Show dashboard
         self.main_frame.setCurrentWidget(self.dashboard_frame)
-        
-        # Update active button
-        self.nav_dashboard.setStyleSheet("background-color: lightgray;")
-        self.nav_stats.setStyleSheet("")
-        self.nav_settings.setStyleSheet("")
-        
+        self._set_active_nav(self.nav_dashboard)
+
     def show_statistics(self):
+        # Build the page on first visit (which refreshes it), otherwise
+        # re-query only when the underlying data changed
+        if self.statistics_frame is None:
+            self.create_statistics_frame()
+            self._stats_dirty = False
+        elif self._stats_dirty:
+            self._stats_dirty = False
+            self.refresh_statistics()
+
         # Show statistics
         self.main_frame.setCurrentWidget(self.statistics_frame)
-        
-        # Update active button
-        self.nav_dashboard.setStyleSheet("")
-        self.nav_stats.setStyleSheet("background-color: lightgray;")
-        self.nav_settings.setStyleSheet("")
-        
+        self._set_active_nav(self.nav_stats)
+
     def show_settings(self):
+        # Build the page on first visit
+        if self.settings_frame is None:
+            self.create_settings_frame()
+
         # Show settings
         self.main_frame.setCurrentWidget(self.settings_frame)
-        
-        # Update active button
-        self.nav_dashboard.setStyleSheet("")
-        self.nav_stats.setStyleSheet("")
-        self.nav_settings.setStyleSheet("background-color: lightgray;")
+        self._set_active_nav(self.nav_settings)
     
     # Action handlers
     def toggle_service(self):
@@ -717,32 +852,52 @@ class MainWindow(QMainWindow):
                 self.file_monitor.stop()
             self.toggle_button.setText("Resume Monitoring") # Set text for the paused state
 
-        # Update status bar
-        last_sort_time_str = "Never"
-        recent_activity = self.stats.get_recent_activity(limit=1)
-        if recent_activity:
-            last_sort_time_str = recent_activity[0]['timestamp'].strftime('%H:%M:%S')
-
-        self.status_label.setText(f"{state} | Last sort: {last_sort_time_str}")
+        # Update status bar from the cached last-sort time; querying the
+        # stats here would flush() the write queue on the UI thread, which
+        # can block for the length of a bulk sort
+        self._set_status(f"{state} | Last sort: {self._last_sort_str}")
 
         # Update tray icon state if it exists
         if self.tray_icon and hasattr(self.tray_icon, 'update_toggle_state'):
             self.tray_icon.update_toggle_state(is_checked)
 
     def sort_now(self):
-        """Manually trigger sorting"""
-        source_folder = self.config.get("source_folder", str(Path.home() / "Downloads"))
+        """Manually trigger sorting on a worker thread so the UI stays responsive"""
+        source_folder = self.config.get("source_folder", DEFAULT_DOWNLOADS)
         if Path(source_folder).exists():
-            # Use the scan_now method which handles both running and non-running states
-            success_count, error_count = self.file_monitor.scan_now()
-            current_time = datetime.now().strftime('%H:%M:%S')
-            state = "Active" if self.file_monitor.is_running() else "Paused"
-            self.status_label.setText(f"{state} | Last sort: {current_time} | {success_count} files sorted")
-            # Refresh dashboard after manual sort
-            self.refresh_dashboard()
+            # Guard against double-triggering while a sort is in flight
+            self.sort_now_btn.setEnabled(False)
+            threading.Thread(target=self._do_sort, daemon=True).start()
         else:
              QMessageBox.warning(self, "Source Folder Not Found", f"The source folder '{source_folder}' does not exist. Please check your settings.")
 
+    def _do_sort(self):
+        """Run the manual sort off the UI thread and report back via signal"""
+        success_count = error_count = 0
+        try:
+            # Use the scan_now method which handles both running and non-running states
+            result = self.file_monitor.scan_now()
+            # sort_directory returns False when the scan itself fails
+            if result:
+                success_count, error_count = result
+        except Exception as e:
+            print(f"Error during manual sort: {e}")
+        finally:
+            # Always emitted, otherwise the Sort Now button stays disabled
+            self.sort_finished.emit(success_count, error_count)
+
+    def _on_sort_finished(self, success_count, error_count):
+        """Update the UI after a manual sort completes (runs on the UI thread)"""
+        self.sort_now_btn.setEnabled(True)
+        self._last_sort_str = datetime.now().strftime('%H:%M:%S')
+        state = "Active" if self.file_monitor.is_running() else "Paused"
+        self._set_status(f"{state} | Last sort: {self._last_sort_str} | {success_count} files sorted")
+        # Refresh dashboard after manual sort; the statistics page picks
+        # up the new data on its next visit
+        self._stats_dirty = True
+        self._stats_data_cache.clear()
+        self.refresh_dashboard()
+
     def save_settings(self):
         """Save application settings"""
         # Update config with values from UI
@@ -757,6 +912,11 @@ class MainWindow(QMainWindow):
         self.config["scan_mode"] = new_scan_mode
         self.config["scan_when_back_online"] = self.offline_recovery_var.isChecked()
 
+        # Save monitoring backend and restart the monitor if it changed
+        new_backend = self.backend_selector.currentText().lower()
+        backend_changed = self.config.get("monitor_backend", "auto") != new_backend
+        self.config["monitor_backend"] = new_backend
+
         # Save scheduled times from UI
         scheduled_times = []
         for i in range(self.time_slots_layout.count()):
@@ -766,7 +926,6 @@ class MainWindow(QMainWindow):
         self.config["scheduled_times"] = sorted(list(set(scheduled_times))) # Ensure unique and sorted
 
         # Save config
-        from sorter.utils import save_config, set_run_at_startup
         save_config(self.config)
         set_run_at_startup(self.config["run_at_startup"])
 
@@ -778,7 +937,7 @@ class MainWindow(QMainWindow):
         # Or if it's running and settings affecting it were changed
         should_restart_monitor = False
         if self.file_monitor and self.file_monitor.is_running():
-            if scan_mode_changed or self.config["source_folder"] != self.file_monitor.config.get("source_folder"):
+            if scan_mode_changed or backend_changed or self.config["source_folder"] != self.file_monitor.config.get("source_folder"):
                  should_restart_monitor = True
             # Add other conditions if needed, e.g., schedule times changed in scheduled mode
 
@@ -797,6 +956,8 @@ class MainWindow(QMainWindow):
         # Refresh UI elements that depend on config
         self.refresh_categories()
         self.refresh_time_slots() # Ensure time slots reflect saved state
+        self._stats_dirty = True # Category changes affect the charts
+        self._stats_data_cache.clear()
         self.refresh_dashboard() # Update category count card
 
     def browse_source(self):
@@ -813,9 +974,6 @@ class MainWindow(QMainWindow):
     
     def add_category(self):
         """Add a new category"""
-        # Would open add category dialog in real implementation
-        from PyQt6.QtWidgets import QInputDialog
-        
         name, ok = QInputDialog.getText(self, "Add Category", "Enter category name:")
         if ok and name and name not in self.config.get("categories", {}):
             extensions, ok = QInputDialog.getText(self, "Add Category", "Enter file extensions (comma separated):")
@@ -833,8 +991,6 @@ class MainWindow(QMainWindow):
     
     def edit_category(self, category_name):
         """Edit a category"""
-        from PyQt6.QtWidgets import QInputDialog
-        
         if category_name in self.config.get("categories", {}):
             current_extensions = ", ".join(self.config["categories"][category_name])
             new_extensions, ok = QInputDialog.getText(self, "Edit Category", 
@@ -863,112 +1019,153 @@ class MainWindow(QMainWindow):
             effective_theme = 'dark'
         elif new_appearance_mode.lower() == "light":
             effective_theme = 'light'
-        else:  # System default
-            try:
-                import darkdetect
-                if darkdetect.isDark():
-                    effective_theme = 'dark'
-                else:
-                    effective_theme = 'light'
-            except ImportError:
-                # If darkdetect is not available, default to light theme
-                effective_theme = 'light'
-                print("darkdetect library not found, defaulting to light theme for 'System' mode.")
+        elif darkdetect is not None and darkdetect.isDark():
+            # System default, resolved against the OS setting; without
+            # darkdetect the light default stands
+            effective_theme = 'dark'
 
         # Apply the appropriate stylesheet
         self.apply_stylesheet(theme=effective_theme)
 
     # Dashboard and statistics methods
     def refresh_dashboard(self):
-        """Refresh the dashboard with current statistics"""
-        # Clear activity list
-        for i in reversed(range(self.activity_list_layout.count())):
-            widget = self.activity_list_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.deleteLater()
-            
-        # Get recent activity data
+        """Refresh the dashboard, querying stats off the UI thread"""
+        threading.Thread(target=self._load_dashboard_data, daemon=True).start()
+
+    def _load_dashboard_data(self):
+        """Run the dashboard queries on a worker thread and report back"""
         recent_activity = self.stats.get_recent_activity(limit=10)
-        
-        if (recent_activity):
-            for activity in recent_activity:
-                self.add_activity_item(
-                    self.activity_list_content,
-                    activity['filename'],
-                    activity['category'],
-                    activity['time_ago']
-                )
-        else:
-            # Show placeholder message when no activity
-            placeholder = QFrame()
-            placeholder_layout = QVBoxLayout(placeholder)
-            
-            placeholder_label = QLabel("No recent activity")
-            placeholder_label.setFont(QFont("Arial", 14))
-            placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            placeholder_layout.addWidget(placeholder_label)
-            
-            self.activity_list_layout.addWidget(placeholder)
-        
-        # Update summary statistics
         total_stats = self.stats.get_total_stats()
-        
+        self.dashboard_data_ready.emit(recent_activity, total_stats)
+
+    def _apply_dashboard_data(self, recent_activity, total_stats):
+        """Update the dashboard widgets (runs on the UI thread)"""
+        if self.is_closing:
+            return
+
+        # Keep the status bar's last-sort time current without a
+        # synchronous query from toggle_service
+        if recent_activity:
+            self._last_sort_str = recent_activity[0]['timestamp'].strftime('%H:%M:%S')
+
+        # Suspend repaints while the rows change so the whole list update
+        # paints once instead of once per touched row
+        self.activity_list_content.setUpdatesEnabled(False)
+        try:
+            self._populate_activity_list(recent_activity)
+        finally:
+            self.activity_list_content.setUpdatesEnabled(True)
+
+        # Update summary statistics
         self.files_sorted_card.setText(str(total_stats['total_files']))
         self.space_saved_card.setText(total_stats['total_size'])
         self.categories_card.setText(str(total_stats['category_count'] or len(self.config.get("categories", {}))))
-    
-    def refresh_statistics(self):
-        """Refresh statistical visualizations"""
-        # Clear existing charts from the frames
-        for i in reversed(range(self.pie_chart_frame.layout().count())):
-            item = self.pie_chart_frame.layout().itemAt(i)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-                
-        for i in reversed(range(self.bar_chart_frame.layout().count())):
-            item = self.bar_chart_frame.layout().itemAt(i)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-            
-        # Get data for the current time range
-        category_data = self.stats.get_category_distribution(self.current_time_range)
-        monthly_data = self.stats.get_monthly_stats(months=6)
-        
-        # Draw pie chart if we have data
-        if category_data:
-            self.draw_pie_chart(self.pie_chart_frame, category_data)
-        else:
-            self.show_no_data_message(self.pie_chart_frame, "No category data available")
-        
-        # Draw bar chart if we have data
-        if monthly_data:
-            self.draw_bar_chart(self.bar_chart_frame, monthly_data)
+
+    def _populate_activity_list(self, recent_activity):
+        """Fill the activity list, reusing row widgets where possible"""
+        if recent_activity:
+            if self._activity_placeholder is not None:
+                self._activity_placeholder.deleteLater()
+                self._activity_placeholder = None
+
+            # Update existing rows in place; only the delta is created/destroyed
+            for i, activity in enumerate(recent_activity):
+                if i < len(self._activity_items):
+                    _, filename_label, details_label = self._activity_items[i]
+                    filename_label.setText(activity['filename'])
+                    details_label.setText(f"{activity['category']} • {activity['time_ago']}")
+                else:
+                    self.add_activity_item(
+                        self.activity_list_content,
+                        activity['filename'],
+                        activity['category'],
+                        activity['time_ago']
+                    )
+
+            # Drop rows beyond the current activity count
+            while len(self._activity_items) > len(recent_activity):
+                item, _, _ = self._activity_items.pop()
+                item.deleteLater()
         else:
-            self.show_no_data_message(self.bar_chart_frame, "No monthly data available")
+            for item, _, _ in self._activity_items:
+                item.deleteLater()
+            self._activity_items.clear()
+
+            # Show placeholder message when no activity
+            if self._activity_placeholder is None:
+                placeholder = QFrame()
+                placeholder_layout = QVBoxLayout(placeholder)
+
+                placeholder_label = QLabel("No recent activity")
+                placeholder_label.setFont(self.font_body)
+                placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                placeholder_layout.addWidget(placeholder_label)
+
+                self.activity_list_layout.addWidget(placeholder)
+                self._activity_placeholder = placeholder
+
+    def refresh_statistics(self):
+        """Refresh the statistics page, querying stats off the UI thread"""
+        threading.Thread(target=self._load_statistics_data, daemon=True).start()
+
+    def _load_statistics_data(self):
+        """Run the statistics queries on a worker thread and report back"""
+        time_range = self.current_time_range
+        # The background monitor sorts without going through the UI, so a
+        # cached entry is only trusted while the cheap total-files counter
+        # still matches the value it was captured under
+        total_files = self.stats.get_total_stats()['total_files']
+        cached = self._stats_data_cache.get(time_range)
+        if cached is None or cached[0] != total_files:
+            cached = (total_files,
+                      self.stats.get_category_distribution(time_range),
+                      self.stats.get_monthly_stats(months=6))
+            self._stats_data_cache[time_range] = cached
+        self.statistics_data_ready.emit(cached[1], cached[2])
+
+    def _apply_statistics_data(self, category_data, monthly_data):
+        """Rebuild the charts from query results (runs on the UI thread)"""
+        if self.is_closing or self.statistics_frame is None:
+            return
+
+        # Suspend repaints while both charts are swapped so the page
+        # repaints once rather than once per chart
+        self.statistics_frame.setUpdatesEnabled(False)
+        try:
+            # Draw pie chart if we have data
+            if category_data:
+                self.draw_pie_chart(category_data)
+            else:
+                self._show_chart_message(self.pie_chart_view, self.pie_message_label,
+                                         "No category data available")
+
+            # Draw bar chart if we have data
+            if monthly_data:
+                self.draw_bar_chart(monthly_data)
+            else:
+                self._show_chart_message(self.bar_chart_view, self.bar_message_label,
+                                         "No monthly data available")
+        finally:
+            self.statistics_frame.setUpdatesEnabled(True)
     
-    def draw_pie_chart(self, parent, data):
+    def draw_pie_chart(self, data):
         """Draw a simple pie chart showing file distribution by category"""
         # Create a pie series
         series = QPieSeries()
-        
+
         # Get total count
         total_count = sum(item['count'] for item in data)
         if total_count == 0:
-            self.show_no_data_message(parent, "No files sorted yet")
+            self._show_chart_message(self.pie_chart_view, self.pie_message_label,
+                                     "No files sorted yet")
             return
         
-        # Define colors for pie slices
-        colors = ['#3498db', '#2ecc71', '#e74c3c', '#f39c12', '#9b59b6', '#1abc9c', '#34495e', '#7f8c8d']
-        
         # Limit to top 7 categories for visualization
         display_data = data[:7] if len(data) > 7 else data
-        
+
         for i, item in enumerate(display_data):
-            percentage = item['count'] / total_count
             slice = series.append(item['category'], item['count'])
-            slice.setBrush(QColor(colors[i % len(colors)]))
+            slice.setBrush(CHART_COLORS[i % len(CHART_COLORS)])
         
         # Create chart
         chart = QChart()
@@ -976,50 +1173,46 @@ class MainWindow(QMainWindow):
         chart.setTitle("Files by Category")
         chart.legend().setVisible(True)
         chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
-        
-        # Create chart view
-        chart_view = QChartView(chart)
-        chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Add chart view to layout
-        parent.layout().addWidget(chart_view)
-    
-    def draw_bar_chart(self, parent, data):
+
+        # Swap the chart onto the persistent view
+        self._set_chart(self.pie_chart_view, self.pie_message_label, chart)
+
+    def draw_bar_chart(self, data):
         """Draw a bar chart showing files sorted by month"""
         # Skip if no data
         if not data or not any(month['categories'] for month in data):
-            self.show_no_data_message(parent, "No monthly data available")
+            self._show_chart_message(self.bar_chart_view, self.bar_message_label,
+                                     "No monthly data available")
             return
         
-        # Define colors for categories
-        colors = ['#3498db', '#2ecc71', '#e74c3c', '#f39c12', '#9b59b6', '#1abc9c', '#34495e']
-        
         # Create bar series
         series = QBarSeries()
         
-        # Get all categories across all months
-        all_categories = set()
+        # Keep the top 5 categories by total count across the window;
+        # slicing the unordered set this used to do plotted an arbitrary
+        # five categories rather than the biggest ones
+        totals = Counter()
         for month in data:
-            all_categories.update(month['categories'].keys())
-            
-        # Filter to top 5 categories for visualization
-        categories = list(all_categories)[:5]
-        
-        # Create bar sets for each category
+            totals.update(month['categories'])
+        categories = [category for category, _ in
+                      heapq.nlargest(5, totals.items(), key=lambda kv: kv[1])]
+        
+        # Build each category's month values in one pass, tracking the axis
+        # maximum as we go, and hand the whole list to QBarSet in a single
+        # bound call instead of appending (and later re-reading) per month
+        max_value = 1  # Default minimum to avoid a zero-height axis
         bar_sets = {}
         for category in categories:
+            values = [month['categories'].get(category, 0) for month in data]
+            if values:
+                max_value = max(max_value, max(values))
             bar_set = QBarSet(category)
+            bar_set.append(values)
             bar_sets[category] = bar_set
-        
-        # Add data to bar sets
-        for month in data:
-            for category in categories:
-                value = month['categories'].get(category, 0)
-                bar_sets[category].append(value)
-        
+
         # Add bar sets to series
         for i, (category, bar_set) in enumerate(bar_sets.items()):
-            bar_set.setColor(QColor(colors[i % len(colors)]))
+            bar_set.setColor(CHART_COLORS[i % len(CHART_COLORS)])
             series.append(bar_set)
         
         # Create chart
@@ -1035,32 +1228,35 @@ class MainWindow(QMainWindow):
         series.attachAxis(axis_x)
         
         axis_y = QValueAxis()
-        max_value = 1  # Default minimum to avoid division by zero
-        for bar_set in bar_sets.values():
-            if len(bar_set) > 0:
-                max_value = max(max_value, max(bar_set))
         axis_y.setRange(0, max_value)
         chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
         series.attachAxis(axis_y)
-        
-        # Create chart view
-        chart_view = QChartView(chart)
-        chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Add chart view to layout
-        parent.layout().addWidget(chart_view)
-    
-    def show_no_data_message(self, parent, message):
-        """Show a message when no data is available for charts"""
-        label = QLabel(message)
-        label.setFont(QFont("Arial", 14))
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        parent.layout().addWidget(label)
+
+        # Swap the chart onto the persistent view
+        self._set_chart(self.bar_chart_view, self.bar_message_label, chart)
+
+    def _set_chart(self, view, message_label, chart):
+        """Install a freshly built chart on a persistent view, releasing
+        the previous chart and hiding any no-data message"""
+        old_chart = view.chart()
+        view.setChart(chart)
+        if old_chart is not None:
+            old_chart.deleteLater()
+        message_label.hide()
+        view.show()
+
+    def _show_chart_message(self, view, message_label, message):
+        """Show a message in place of a chart when no data is available"""
+        message_label.setText(message)
+        view.hide()
+        message_label.show()
     
     def change_time_range(self, value):
         """Change the time range for statistics"""
         self.current_time_range = value.lower()
-        self.refresh_statistics()
+        # Restarting the single-shot timer collapses a burst of selector
+        # clicks into a single redraw once the user settles
+        self._stats_refresh_timer.start()
     
     def toggle_schedule_options(self):
         """Show or hide schedule options based on selected scan mode"""
@@ -1071,8 +1267,6 @@ class MainWindow(QMainWindow):
             
     def add_scheduled_time(self):
         """Add a new scheduled scan time"""
-        from PyQt6.QtWidgets import QInputDialog
-        
         # Show time picker dialog
         time_str, ok = QInputDialog.getText(self, "Add Scheduled Time", 
                                         "Enter time (24-hour format, HH:MM):",
@@ -1117,7 +1311,7 @@ class MainWindow(QMainWindow):
         if not scheduled_times:
             # Show placeholder when no times are scheduled
             placeholder_label = QLabel("No scheduled times set")
-            placeholder_label.setFont(QFont("Arial", 14))
+            placeholder_label.setFont(self.font_body)
             placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.time_slots_layout.addWidget(placeholder_label)
         else:
@@ -1134,7 +1328,7 @@ class MainWindow(QMainWindow):
 
         # Time display
         time_label = QLabel(time_str)
-        time_label.setFont(QFont("Arial", QFont.Weight.Bold))
+        time_label.setFont(self.font_label_bold)
         slot_layout.addWidget(time_label)
         
         slot_layout.addStretch()
@@ -1154,6 +1348,12 @@ class MainWindow(QMainWindow):
             
     def apply_stylesheet(self, theme='light'):
         """Load and apply the application stylesheet based on the theme"""
+        # Re-applying the same theme would re-read the QSS file and
+        # re-polish every widget for no visible change
+        if theme == self._applied_theme:
+            return
+        self._applied_theme = theme
+
         qss_file = "style.qss" if theme == 'light' else "style_dark.qss"
         stylesheet_path = Path(__file__).parent / "resources" / qss_file
 